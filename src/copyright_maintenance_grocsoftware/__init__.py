@@ -26,10 +26,13 @@ Utilities to get the creation and last modification years of a file
 
 __version__ = '0.8.3'
 
-__all__ = ["copyright_tools", "comment_block", "file_dates", "oscmdshell", "update_copyright"]
+__all__ = ["copyright_tools", "copyright_parse_set", "comment_block", "file_dates",
+           "line_reader", "oscmdshell", "update_copyright"]
 
 from . import copyright_tools
+from . import copyright_parse_set
 from . import comment_block
 from . import file_dates
+from . import line_reader
 from . import oscmdshell
 from . import update_copyright
@@ -25,14 +25,20 @@ Scan source files to find comment block(s). Utility to generate new comment bloc
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import functools
 import os
-import re
+from types import MappingProxyType
+
+from copyright_maintenance_grocsoftware.line_reader import FileLineReader
 
 class TextFileCommentBlock():
     """!
     Identify the start and end of a comment text block
 
     """
+    __slots__ = ("comment_blk_strt_off", "comment_blk_eol_off", "_input_file",
+                 "_foundtext_start")
+
     def __init__(self, input_file):
         """!
         @brief Constructor
@@ -58,8 +64,7 @@ class TextFileCommentBlock():
         is__current_start = False
 
         if not self._foundtext_start:
-            start_match = re.search(r'\S', current_line)
-            if start_match is not None:
+            if current_line and not current_line.isspace():
                 self._foundtext_start = True
                 is__current_start = True
 
@@ -76,8 +81,7 @@ class TextFileCommentBlock():
         is_current_end = False
 
         if self._foundtext_start:
-            end_match = re.search(r'\S', current_line)
-            if end_match is None:
+            if (not current_line) or current_line.isspace():
                 self._foundtext_start = False     # Reset text file block start
                 is_current_end = True
 
@@ -90,39 +94,33 @@ class TextFileCommentBlock():
         @return bool: True if comment block found, else False
         """
 
-        # initialize working variables
-        previous_line = ""
-        previous_line_off = None
-
         self.comment_blk_strt_off = None
         self.comment_blk_eol_off = None
 
         comment_block_found = False
-        self.comment_blk_eol_off = None
-        while not comment_block_found:
-            # Read the test line
-            current_line_offset = self._input_file.tell()
-            current_line = self._input_file.readline()
-            if not current_line:
-                # Check for special text file case
-                if ((self.comment_blk_strt_off is not None) and
-                    (self.comment_blk_eol_off is None)):
-                    self.comment_blk_eol_off = previous_line_off + len(previous_line)
+        line_reader = FileLineReader(self._input_file)
+        for current_line_offset, current_line in line_reader:
+            # Check for comment block start or end, the line reader never returns empty lines
+            line_has_text = not current_line.isspace()
+            if line_has_text != self._foundtext_start:
+                self._foundtext_start = line_has_text
+                if line_has_text:
+                    # Process comment block start
+                    self.comment_blk_strt_off = current_line_offset
+                else:
+                    # Process comment block end
+                    self.comment_blk_eol_off = line_reader.offset
                     comment_block_found = True
-                break
+                    break
 
-            # Check for comment block start or end
-            if self.is_current_line_comment_start(current_line):
-                # Process comment block start
-                self.comment_blk_strt_off = current_line_offset
-            elif self.is_current_line_comment_end(current_line):
-                # Process comment block end
-                self.comment_blk_eol_off = current_line_offset + len(current_line)
-                comment_block_found = True
+        # Check for special text file case, block ends at the end of the file
+        if ((not comment_block_found) and
+            (self.comment_blk_strt_off is not None)):
+            self.comment_blk_eol_off = line_reader.offset
+            comment_block_found = True
 
-            # Move to the next line and return true to continue for each loop
-            previous_line = current_line
-            previous_line_off = current_line_offset
+        # Leave the file at the line following the last line scanned
+        line_reader.update_file_position()
 
         # return if we found a comment block
         return comment_block_found
@@ -132,37 +130,38 @@ class CommentParams(): # pylint: disable=too-few-public-methods
     Comment marker definitions and static selection methods
     """
     ##C/C++/Typescript/Javascript comment marker dictionary
-    cCommentParms =   {'blockStart': "/*",
-                       'blockEnd': "*/",
-                       'blockLineStart': "",
-                       'singleLine': "//"}
+    cCommentParms =   MappingProxyType({'blockStart': "/*",
+                                        'blockEnd': "*/",
+                                        'blockLineStart': "",
+                                        'singleLine': "//"})
     ##Python comment marker dictionary
-    pyCommentParms =  {'blockStart': "\"\"\"",
-                       'blockEnd':"\"\"\"",
-                       'blockLineStart': "",
-                       'singleLine': "#"}
+    pyCommentParms =  MappingProxyType({'blockStart': "\"\"\"",
+                                        'blockEnd':"\"\"\"",
+                                        'blockLineStart': "",
+                                        'singleLine': "#"})
     ##Bash shell comment marker dictionary
-    shCommentParms =  {'blockStart': None,
-                       'blockEnd': None,
-                       'blockLineStart': "#",
-                       'singleLine': "#"}
+    shCommentParms =  MappingProxyType({'blockStart': None,
+                                        'blockEnd': None,
+                                        'blockLineStart': "#",
+                                        'singleLine': "#"})
     ##Batch comment marker dictionary
-    batCommentParms = {'blockStart': None,
-                       'blockEnd': None,
-                       'blockLineStart': "REM ",
-                       'singleLine': "REM "}
-
-    ##Comment block marker by file extention lookup dictionary
-    commentBlockDelim = {'.c':   cCommentParms,
-                         '.cpp': cCommentParms,
-                         '.h':   cCommentParms,
-                         '.hpp': cCommentParms,
-                         '.js':  cCommentParms,
-                         '.ts':  cCommentParms,
-                         '.py':  pyCommentParms,
-                         '.sh':  shCommentParms,
-                         '.bat': batCommentParms,
-                         }
+    batCommentParms = MappingProxyType({'blockStart': None,
+                                        'blockEnd': None,
+                                        'blockLineStart': "REM ",
+                                        'singleLine': "REM "})
+
+    ##Comment block marker by file extention lookup dictionary, read only so the shared
+    ##marker entries can not be modified through a returned entry
+    commentBlockDelim = MappingProxyType({'.c':   cCommentParms,
+                                          '.cpp': cCommentParms,
+                                          '.h':   cCommentParms,
+                                          '.hpp': cCommentParms,
+                                          '.js':  cCommentParms,
+                                          '.ts':  cCommentParms,
+                                          '.py':  pyCommentParms,
+                                          '.sh':  shCommentParms,
+                                          '.bat': batCommentParms,
+                                          })
 
     @staticmethod
     def get_comment_markers(filename:str)->dict:
@@ -174,20 +173,28 @@ class CommentParams(): # pylint: disable=too-few-public-methods
         @return dictionary: commentBlockDelim entry that matches the file extension or
                             None if no extension match is found
         """
-        name_ext = os.path.splitext(filename)
-        extension = name_ext[1]
+        return CommentParams.commentBlockDelim.get(os.path.splitext(filename)[1])
 
-        try:
-            ret_data = CommentParams.commentBlockDelim[extension]
-        except KeyError:
-            ret_data = None
+@functools.lru_cache(maxsize=None)
+def _get_start_markers(block_start:str, single_line:str)->tuple:
+    """!
+    @brief Build the comment block start line markers tuple, built once per marker set
+
+    @param block_start (string): Comment block start marker or None
+    @param single_line (string): Single line comment marker or None
 
-        return ret_data
+    @return tuple: Markers that a comment block start line can start with
+    """
+    return tuple(marker for marker in (block_start, single_line) if marker is not None)
 
 class CommentBlock():
     """!
     Identify the start and end of a comment block
     """
+    __slots__ = ("comment_blk_strt_off", "comment_blk_eol_off", "comment_blk_sol_off",
+                 "_input_file", "comment_data", "_block_start", "_block_end", "_single_line",
+                 "_start_markers")
+
     def __init__(self, input_file, comment_markers:dict = None):
         """!
         @brief Constructor
@@ -208,6 +215,22 @@ class CommentBlock():
         ## Comment block markers typical for the file type
         self.comment_data = comment_markers
 
+        if comment_markers is not None:
+            ## Comment block start marker or None if the file type has no block comments
+            self._block_start = comment_markers["blockStart"]
+            ## Comment block end marker or None if the file type has no block comments
+            self._block_end = comment_markers["blockEnd"]
+            ## Single line comment marker
+            self._single_line = comment_markers["singleLine"]
+        else:
+            self._block_start = None
+            self._block_end = None
+            self._single_line = None
+
+        ## Line start markers of a comment block start line, a line that starts with none
+        ## of these markers can not start a comment block
+        self._start_markers = _get_start_markers(self._block_start, self._single_line)
+
     def is_current_line_comment_start(self, current_line:str)->bool:
         """!
         @brief Determine if the input current line is the start of a comment block
@@ -216,9 +239,8 @@ class CommentBlock():
 
         @return bool: True if this line is the start of a comment block, else False
         """
-        if ((self.comment_data is not None) and
-            (self.comment_data["blockStart"] is not None)):
-            if 0 == current_line.find(self.comment_data["blockStart"]):
+        if self._block_start is not None:
+            if current_line.startswith(self._block_start):
                 return True
         return False
 
@@ -231,9 +253,9 @@ class CommentBlock():
 
         @return bool: True if the previous line is the start of a comment block, else False
         """
-        if (self.comment_data is not None) and (previous_line is not None):
-            if ((0 == previous_line.find(self.comment_data["singleLine"])) and
-                (0 == current_line.find(self.comment_data["singleLine"]))):
+        if (self._single_line is not None) and (previous_line is not None):
+            if ((previous_line.startswith(self._single_line)) and
+                (current_line.startswith(self._single_line))):
                 return True
         return False
 
@@ -245,9 +267,8 @@ class CommentBlock():
 
         @return bool: True if the current line is the end of a comment block, else False
         """
-        if ((self.comment_data is not None) and
-            (self.comment_data["blockEnd"] is not None)):
-            if -1 != current_line.find(self.comment_data["blockEnd"]):
+        if self._block_end is not None:
+            if self._block_end in current_line:
                 return True
         return False
 
@@ -260,9 +281,9 @@ class CommentBlock():
 
         @return bool: True if the previous line is the end of a comment block, else False
         """
-        if (self.comment_data is not None) and (previous_line is not None):
-            if ((0 == previous_line.find(self.comment_data["singleLine"])) and
-                (0 != current_line.find(self.comment_data["singleLine"]))):
+        if (self._single_line is not None) and (previous_line is not None):
+            if ((previous_line.startswith(self._single_line)) and
+                (not current_line.startswith(self._single_line))):
                 return True
         return False
 
@@ -280,38 +301,49 @@ class CommentBlock():
         self.comment_blk_strt_off = None
         self.comment_blk_eol_off = None
 
-        comment_block_found = False
+        # Without comment markers no comment block can be found, skip reading the file
+        if not self._start_markers:
+            return False
 
-        while not comment_block_found:
-            # Read the test line
-            current_line_offset = self._input_file.tell()
-            current_line = self._input_file.readline()
-            if not current_line:
-                break
+        # File types without block comments (shell, batch) only use the single line checks
+        has_block_start = self._block_start is not None
+        has_block_end = self._block_end is not None
 
+        comment_block_found = False
+        line_reader = FileLineReader(self._input_file)
+
+        for current_line_offset, current_line in line_reader:
             # Check for comment block start or end
             if self.comment_blk_strt_off is None:
-                if self.is_current_line_comment_start(current_line):
-                    # Process comment block start
-                    self.comment_blk_strt_off = current_line_offset
-                elif self._is_previous_line_comment_start(previous_line, current_line):
-                    # Process comment block start
-                    self.comment_blk_strt_off = previous_line_off
+                # Both start checks require the line to start with a start marker
+                if current_line.startswith(self._start_markers):
+                    if has_block_start and self.is_current_line_comment_start(current_line):
+                        # Process comment block start
+                        self.comment_blk_strt_off = current_line_offset
+                    elif self._is_previous_line_comment_start(previous_line, current_line):
+                        # Process comment block start
+                        self.comment_blk_strt_off = previous_line_off
             else:
-                if self.is_current_line_comment_end(current_line):
+                if has_block_end and self.is_current_line_comment_end(current_line):
                     # Process comment block end
                     self.comment_blk_sol_off = current_line_offset
-                    self.comment_blk_eol_off = current_line_offset + len(current_line)
+                    self.comment_blk_eol_off = line_reader.offset
                     comment_block_found = True
                 elif self._is_previous_line_comment_end(previous_line, current_line):
                     # Process comment block end
                     self.comment_blk_sol_off = previous_line_off
-                    self.comment_blk_eol_off = previous_line_off + len(previous_line)
+                    self.comment_blk_eol_off = current_line_offset
                     comment_block_found = True
 
+            if comment_block_found:
+                break
+
             # Move to the next line and return true to continue for each loop
             previous_line = current_line
             previous_line_off = current_line_offset
 
+        # Leave the file at the line following the last line scanned
+        line_reader.update_file_position()
+
         # return if we found a comment block
         return comment_block_found
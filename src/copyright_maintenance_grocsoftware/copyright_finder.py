@@ -26,12 +26,44 @@ generate updates copyright text
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 from copyright_maintenance_grocsoftware.copyright_tools import CopyrightParseEnglish
+from copyright_maintenance_grocsoftware.line_reader import FileLineReader
+from copyright_maintenance_grocsoftware.line_reader import open_for_scan
+
+## Number of file paths sent to a scan_paths() worker process at a time
+SCAN_CHUNK_SIZE = 32
+
+@functools.lru_cache(maxsize=None)
+def _get_default_parser()->CopyrightParseEnglish:
+    """!
+    @brief Get the default copyright parser, created once and shared by all the finders
+           that use the default. The finder only checks lines with the parser, it never
+           changes the parser state.
+
+    @return CopyrightParseEnglish: Default copyright parser object
+    """
+    return CopyrightParseEnglish()
 
 class CopyrightFinder():
     """!
     Copyright message finder class
+
+    Files may be open in text or binary mode, the file bytes are searched for the copyright
+    word and only the lines that contain it are decoded, as UTF-8 for binary mode files.
+
+    The finder holds no per file state, construct it once and reuse it for every file
+    scanned instead of building a new finder and parser for each file.
     """
+    __slots__ = ("_parser",)
+
+    ## Size of the file head searched by find_copyright_msg(), copyright messages are
+    ## conventionally in the first lines of a file
+    HEAD_SCAN_BYTES = 8192
+
     def __init__(self, parser = None):
         """!
         @brief Constructor
@@ -43,7 +75,36 @@ class CopyrightFinder():
         ## default copyright text and order specification
         self._parser = parser
         if parser is None:
-            self._parser = CopyrightParseEnglish()
+            self._parser = _get_default_parser()
+
+    def _iter_copyright_matches(self, input_file, start_offset:int, end_offset:int = None):
+        """!
+        @brief Scan the file forward once from the start_offset location and return each
+               copyright message line found
+
+        The file is left at the line following the last line scanned when the generator
+        is exhausted or closed.
+
+        @param input_file (file object): File object, open for reading
+        @param start_offset (file offset): File offset to begin the scan at.
+        @param end_offset (file offset): File offset to end the scan at or None to continue to
+                                         end of file
+
+        @return generator: (file offset of the copyright line, copyright text line) tuples
+        """
+        input_file.seek(start_offset)
+
+        # Only the lines containing the copyright word literal can be copyright lines
+        line_reader = FileLineReader(input_file)
+        try:
+            for current_line_offset, current_line in line_reader.find_lines(
+                                                        self._parser.copyright_literals,
+                                                        end_offset):
+                if self._parser.is_copyright_line(current_line):
+                    yield current_line_offset, current_line
+        finally:
+            # Leave the file at the line following the last line scanned
+            line_reader.update_file_position()
 
     def find_next_copyright_msg(self, input_file, start_offset:int,
                                 end_offset:int = None)->tuple:
@@ -61,44 +122,41 @@ class CopyrightFinder():
                             {'lineOffset': file offset of the copy right line,
                              'text': Copyright text line from the file}
         """
-
         copyright_found = False
         location_dict = None
-        input_file.seek(start_offset)
-
-        while not copyright_found:
-            # Read the test line
-            current_line_offset = input_file.tell()
-            current_line = input_file.readline()
-
-            # Check for end of file
-            if not current_line:
-                break
 
-            # check for search end
-            if end_offset is not None:
-                if current_line_offset >= end_offset:
-                    break
-
-            # Check for match
-            if self._parser.is_copyright_line(current_line):
-                location_dict = {'lineOffset': current_line_offset, 'text': current_line}
-                copyright_found = True
+        copyright_matches = self._iter_copyright_matches(input_file, start_offset, end_offset)
+        for current_line_offset, current_line in copyright_matches:
+            location_dict = {'lineOffset': current_line_offset, 'text': current_line}
+            copyright_found = True
+            break
+        copyright_matches.close()
 
         return copyright_found, location_dict
 
-    def find_copyright_msg(self, input_file)->tuple:
+    def find_copyright_msg(self, input_file, exhaustive:bool = True)->tuple:
         """!
-        @brief Scan the current file from the current location to find a copyright messge
+        @brief Scan the file to find a copyright messge, the lines starting in the first
+               HEAD_SCAN_BYTES of the file are scanned first
 
         @param input_file (file object): File object, open for reading
+        @param exhaustive (bool): True to continue the scan to the end of file if the copyright
+                                  message is not in the file head, else False to only scan
+                                  the file head
 
         @return bool: True if copyright block is found, else false
         @return dictionary: Copyright message location data dictionary
                             {'lineOffset': file offset of the copy right line,
                              'text': Copyright text line from the file}
         """
-        return self.find_next_copyright_msg(input_file, 0, None)
+        copyright_found, location_dict = self.find_next_copyright_msg(input_file, 0,
+                                                                      self.HEAD_SCAN_BYTES)
+        if (not copyright_found) and exhaustive:
+            # Continue from the first line after the file head
+            copyright_found, location_dict = self.find_next_copyright_msg(input_file,
+                                                                          input_file.tell(),
+                                                                          None)
+        return copyright_found, location_dict
 
     def find_all_copyright_msg(self, input_file)->tuple:
         """!
@@ -108,22 +166,75 @@ class CopyrightFinder():
                                     {'lineOffset': file offset of the copy right line,
                                      'text': Copyright text line from the file}
         """
-        copyright_dict_list = []
-        start_location = 0
+        # Collect all the copyright lines in a single forward scan of the file
+        copyright_dict_list = [{'lineOffset': current_line_offset, 'text': current_line}
+                               for current_line_offset, current_line
+                               in self._iter_copyright_matches(input_file, 0, None)]
         return_status = False
         return_text = None
 
-        while True:
-            copyright_found, location_dict = self.find_next_copyright_msg(input_file,
-                                                                          start_location,
-                                                                          None)
-            if copyright_found:
-                copyright_dict_list.append(location_dict)
-                start_location = location_dict['lineOffset'] + len(location_dict['text'])
-            else:
-                break
-
         if copyright_dict_list:
             return_status = True
             return_text = copyright_dict_list
         return return_status, return_text
+
+@functools.lru_cache(maxsize=None)
+def _get_worker_finder()->CopyrightFinder:
+    """!
+    @brief Get the default copyright finder, created once per scan_paths() worker process
+
+    @return CopyrightFinder: Default copyright finder object
+    """
+    return CopyrightFinder()
+
+def _scan_one(file_path:str)->list:
+    """!
+    @brief Find all the copyright messages in a file, scan_paths() worker function
+
+    @param file_path (string): Path and file name of the file to scan
+
+    @return list of dictionary: Copyright message location data dictionaries or None if no
+                                copyright message is found or the file can not be read
+    """
+    try:
+        with open_for_scan(file_path) as input_file:
+            _, copyright_dict_list = _get_worker_finder().find_all_copyright_msg(input_file)
+    except (UnicodeDecodeError, OSError):
+        # Unreadable or non UTF-8 (binary) file, skip it instead of ending the scan
+        copyright_dict_list = None
+    return copyright_dict_list
+
+def scan_paths(file_paths, workers:int = None):
+    """!
+    @brief Find all the copyright messages in a list of files, the files are scanned in
+           parallel by a pool of worker processes
+
+    @param file_paths (iterable of string): Path and file names of the files to scan
+    @param workers (int): Number of worker processes or None to use the processor count
+
+    @return generator: (file path, copyright message location data dictionary list or None)
+                       tuples in the file_paths order
+    """
+    file_paths = list(file_paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from zip(file_paths, executor.map(_scan_one, file_paths,
+                                                chunksize=SCAN_CHUNK_SIZE))
+
+def scan_tree(root_dir:str, workers:int = None):
+    """!
+    @brief Find all the copyright messages in the files of a directory tree, the files are
+           scanned in parallel by a pool of worker processes
+
+    Hidden directories, such as .git, are not scanned.
+
+    @param root_dir (string): Path of the top directory of the tree to scan
+    @param workers (int): Number of worker processes or None to use the processor count
+
+    @return generator: (file path, copyright message location data dictionary list or None)
+                       tuples
+    """
+    file_paths = []
+    for dir_path, dir_names, file_names in os.walk(root_dir):
+        dir_names[:] = sorted(dir_name for dir_name in dir_names if not dir_name.startswith("."))
+        file_paths.extend(os.path.join(dir_path, file_name) for file_name in sorted(file_names))
+    yield from scan_paths(file_paths, workers)
@@ -34,6 +34,8 @@ class CopyrightGenerator():
     on a previously parsed copyright message and new dates or completely
     new copyright messages if a previously parsed message is unavailable.
     """
+    __slots__ = ("parser",)
+
     def __init__(self, parser = None):
         """!
         @brief Constructor
@@ -41,81 +43,58 @@ class CopyrightGenerator():
         ## Copyright parser object for parsed data, default copyright text and order specification
         self.parser = parser
         if parser is None:
+            # The generator parses messages into the parser and changes its owner, use a
+            # parser of its own instead of a shared default
             self.parser = CopyrightParseEnglish()
 
-    @staticmethod
-    def _is_multi_year(create_year:int, last_modify_year:int=None)->bool:
-        """!
-        Determine if this is a multi or single year message
-
-        @param create_year (integer): File creation date
-        @param last_modify_year (integer): Last modification date of the file or None
-
-        @return bool - True if last_modify_year is not None and last_modify_year != create_year
-        """
-        result = False
-        if last_modify_year is not None:
-            result = bool(last_modify_year != create_year)
-        return result
-
-    def _get_new_copyright_msg(self, create_year:int, last_modify_year:int = None)->tuple:
+    def _get_new_copyright_msg(self, create_year:int, last_modify_year:int = None,
+                               current_text:str = None)->tuple:
         """
         @brief Determine if a new copyright message is required and return if message changed
                and the new copyright message
 
         @param create_year (integer): File creation date
         @param last_modify_year (integer): Last modification date of the file
+        @param current_text (string): Parsed copyright message text if already known by the
+                                      caller, returned if the message is unchanged, or None
+                                      to get the text from the parser
 
         @return bool: True is the copyright dates changed, else false
         @return string : New or old copyright message
         """
-        copyright_year_list = self.parser.get_copyright_dates()
+        parser = self.parser
+        copyright_year_list = parser.get_copyright_dates()
+        year_count = len(copyright_year_list)
 
-        # Convert match text to year integers
-        current_start_year = int(copyright_year_list[0])
+        # The parsed dates are already year integers
+        current_start_year = copyright_year_list[0]
+        current_modify_year = copyright_year_list[-1]
 
         # Don't move copyright forward
-        if current_start_year < create_year:
-            start_year = current_start_year
-        else:
-            start_year = create_year
+        start_year = min(current_start_year, create_year)
 
         # Test if input is multiyear or current is multiyear
-        if ((CopyrightGenerator._is_multi_year(create_year, last_modify_year)) or
-            (len(copyright_year_list) > 1)):
-
-            # Convert match text to year integers
-            current_modify_year = int(copyright_year_list[-1])
+        if (((last_modify_year is not None) and (last_modify_year != create_year)) or
+            (year_count > 1)):
             if last_modify_year is None:
-                if create_year > current_modify_year:
-                    last_modify_year = create_year
-                else:
-                    last_modify_year = current_modify_year
+                last_modify_year = max(create_year, current_modify_year)
 
             # Check for change
-            if ((current_start_year == start_year) and
-                (current_modify_year == last_modify_year)):
-                # No need to change return the old line
-                new_copyright_msg = self.parser.get_copyright_text()
-                msg_changed = False
-            else:
-                # Generate the new message
-                new_copyright_msg = self.parser.build_new_copyright_msg(start_year,
-                                                                        last_modify_year,
-                                                                        True)
-                msg_changed = True
+            msg_changed = ((current_start_year != start_year) or
+                           (current_modify_year != last_modify_year))
+        else:
+            msg_changed = ((year_count != 1) or
+                           (start_year != current_start_year))
+
+        if msg_changed:
+            # Generate the new message
+            new_copyright_msg = parser.build_new_copyright_msg(start_year, last_modify_year, True)
         else:
-            if ((len(copyright_year_list) == 1) and
-                (start_year == current_start_year)):
-                # No need to change return the old line
-                new_copyright_msg = self.parser.get_copyright_text()
-                msg_changed = False
+            # No need to change return the old line
+            if current_text is not None:
+                new_copyright_msg = current_text
             else:
-                # Update with a new line
-                new_copyright_msg = self.parser.build_new_copyright_msg(start_year,
-                                                                        last_modify_year,
-                                                                        True)
-                msg_changed = True
+                new_copyright_msg = parser.get_copyright_text()
 
         return msg_changed, new_copyright_msg
 
@@ -132,19 +111,24 @@ class CopyrightGenerator():
         new_copyright_msg =  self.parser.create_copyright_msg("None", create_year, last_modify_year)
         return True, new_copyright_msg
 
-    def get_new_copyright_msg(self, create_year:int, last_modify_year:int = None)->tuple:
+    def get_new_copyright_msg(self, create_year:int, last_modify_year:int = None,
+                              current_text:str = None)->tuple:
         """!
         @brief Determine if a new copyright message is required and return if message changed
                and the new copyright message
 
         @param create_year (integer): File creation date
         @param last_modify_year (integer): Last modification date of the file or None
+        @param current_text (string): Parsed copyright message text if already known by the
+                                      caller, returned if the message is unchanged, or None
+                                      to get the text from the parser
 
         @return bool: True is the copyright dates changed, else false
         @return string : New or old copyright message
         """
         if self.parser.is_copyright_text_valid():
-            return_data = self._get_new_copyright_msg(create_year, last_modify_year)
+            return_data = self._get_new_copyright_msg(create_year, last_modify_year,
+                                                      current_text)
         else:
             return_data = self._get_default_copyright_msg(create_year, last_modify_year)
         return return_data
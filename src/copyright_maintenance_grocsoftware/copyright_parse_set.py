@@ -0,0 +1,119 @@
+"""@package copyright_maintenance
+@brief Copyright line check over a set of copyright parsers
+"""
+
+#==========================================================================
+# Copyright (c) 2026 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+class CopyrightParseSet():
+    """!
+    @brief Copyright line check over a set of copyright parsers
+
+    Combine several parsers, for example one per message language, into a single
+    copyright line check. The copyright word literals of all the parsers are searched
+    together so a file is scanned once for all of them, and a line is only passed to
+    the parsers whose copyright word literal it contains.
+
+    The set only supports the line checks. Use it in place of a single parser with
+    CopyrightFinder and scan_lines() to find the copyright lines, then parse a found line
+    with the parser returned by get_matching_parser().
+    """
+    def __init__(self, parsers:list):
+        """!
+        @brief Constructor
+
+        @param parsers (list of CopyrightParse objects): Parsers to check the lines with,
+                                                         in priority order
+        """
+        ## Parsers to check the lines with, in priority order
+        self.parsers = tuple(parsers)
+
+    @property
+    def copyright_literals(self)->tuple:
+        """!
+        @brief Literal strings, one of which must be in a copyright line
+
+        @return tuple - Literal strings of all the parsers or None if any parser
+                        has no literal strings
+        """
+        literals = []
+        for parser in self.parsers:
+            parser_literals = parser.copyright_literals
+            if parser_literals is None:
+                return None
+            literals.extend(literal for literal in parser_literals if literal not in literals)
+        return tuple(literals)
+
+    def has_copyright_literal(self, test_string:str)->bool:
+        """!
+        @brief Cheap check run before is_copyright_line() to skip lines that can not
+               contain the copyright message word of any of the parsers
+
+        @param test_string (string): Line of text to check
+
+        @return bool - False if the line can not be a copyright line, else True
+        """
+        for parser in self.parsers:
+            if parser.has_copyright_literal(test_string):
+                return True
+        return False
+
+    def get_matching_parser(self, copyright_string:str):
+        """!
+        @brief Find the first parser that matches the copyright message
+
+        @param copyright_string (string) Line of text to check
+
+        @return CopyrightParse object - Parser that matched the line or None if no parser
+                                        matched it
+        """
+        for parser in self.parsers:
+            if ((parser.has_copyright_literal(copyright_string)) and
+                (parser.is_copyright_line(copyright_string))):
+                return parser
+        return None
+
+    def is_copyright_line(self, copyright_string:str)->bool:
+        """!
+        @brief Check if the input text is a copyright message for any of the parsers
+
+        @param copyright_string (string) Line of text to check
+
+        @return boolean - True if one of the parsers matched the line, else False
+        """
+        return self.get_matching_parser(copyright_string) is not None
+
+def scan_lines(parser, lines):
+    """!
+    @brief Find the copyright lines in a sequence of text lines
+
+    Lines without the copyright message word are skipped before any of the year,
+    tag or owner parsing is done.
+
+    @param parser (CopyrightParse or CopyrightParseSet object): Copyright parser to check with
+    @param lines (iterable of string): Lines of text to check
+
+    @return generator: (line index, copyright text line) tuples
+    """
+    for line_index, current_line in enumerate(lines):
+        if parser.has_copyright_literal(current_line) and parser.is_copyright_line(current_line):
+            yield line_index, current_line
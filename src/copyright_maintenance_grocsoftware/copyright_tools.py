@@ -26,12 +26,60 @@ generate updates copyright text
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 #==========================================================================
 
+import array
+import functools
 import re
 
+## Four digit year search regex
+_FOUR_DIGIT_YEAR_REGX = re.compile(r'(\d{4})')
+## First alphanumeric character search regex
+_ALPHANUMERIC_REGX = re.compile(r'[a-zA-Z0-9]')
+## Any digit search regex, year text always contains a digit
+_DIGIT_REGX = re.compile(r'\d')
+
+def _count_leading_spaces(test_string:str)->int:
+    """!
+    @brief Find the index of the first non-space character
+
+    @param test_string (string): String to check
+
+    @return int - Number of space characters at the start of the string
+    """
+    return len(test_string) - len(test_string.lstrip(' '))
+
+@functools.lru_cache(maxsize=None)
+def _compile_regx(regx_string:str, regx_flags:re.RegexFlag)->re.Pattern:
+    """!
+    @brief Compile a regular expression once, parser objects created with the same
+           search strings share the compiled expression
+
+    @param regx_string (string): Regular expression string
+    @param regx_flags (re.RegexFlag): Regular expression compile flags
+
+    @return re.Pattern - Compiled regular expression
+    """
+    return re.compile(regx_string, regx_flags)
+
+@functools.lru_cache(maxsize=4096)
+def _get_year_string(create_year:int, last_modify_year:int = None)->str:
+    """!
+    @brief Build the copyright year string, built once per year pair
+
+    @param create_year (integer): File creation date
+    @param last_modify_year (integer): File last modification date or None
+
+    @return string : Single year or year range string
+    """
+    if (last_modify_year is None) or (create_year == last_modify_year):
+        return str(create_year)
+    return "-".join((str(create_year), str(last_modify_year)))
+
 class SubTextMarker():
     """!
     @brief Regex trimmed substrng text and location information
     """
+    __slots__ = ("text", "start", "end")
+
     def __init__(self, new_text:str, original_start:int):
         """!
         * @brief Process the input string to remove leading and trailing white space
@@ -40,12 +88,24 @@ class SubTextMarker():
         * @param new_text {string} - String data.
         * @param original_start {int} - starting index new_text within the base string
         """
-        trimed_text = new_text.lstrip()
+        if new_text and (new_text[0].isspace() or new_text[-1].isspace()):
+            ## Trimmed text value
+            self.text = new_text.strip()
+
+            # The trimmed text starts with the first non-white space character, so its first
+            # occurrence in the input string is the trimmed start position
+            if self.text:
+                leading_space = new_text.find(self.text)
+            else:
+                leading_space = len(new_text)
+
+            ## Starting position from the start of the input string plus original_start value
+            self.start = original_start + leading_space
+        else:
+            # Nothing to trim, the common case for regex matched text
+            self.text = new_text
+            self.start = original_start
 
-        ## Trimmed text value
-        self.text = trimed_text.rstrip()
-        ## Starting position from the start of the input string plus original_start value
-        self.start = original_start + (len(new_text) - len(trimed_text))
         ## Ending position from the start of the input string plus original_start value
         self.end = self.start + len(self.text)
 
@@ -74,31 +134,53 @@ class CopyrightYearsList():
     """!
     Parse dates return data structure
     """
+    __slots__ = ("_intyears", "_start", "_end")
+
     def __init__(self, year_string:str, year_regex:str, base_index:int = 0):
         """!
         Default constructor
 
         @param year_string {string} - String to parse years from
-        @param year_regex {RegExp} - Regex year matching criteria
+        @param year_regex {RegExp} - Regex year matching criteria, compiled or string
         @param base_index {int} - Index of the year data substring within the original string
         """
-        ## List of found years as strings
-        self._years = []
-        ## List of found years as integers
-        self._intyears = []
+        ## Compact array of the found years as integers
+        self._intyears = array.array('i')
         ## Start index of the first date text within the parsed input string
         self._start = -1
         ## End index of the last date text within the parsed input string
         self._end = -1
 
-        for year_match in re.finditer(year_regex, year_string):
-            # Get the found year
-            self._years.append(year_match.group())
-            self._intyears.append(self._parse_year_from_date_str(year_match.group()))
+        # Use the compiled expression directly, compile a regex string once
+        if isinstance(year_regex, str):
+            year_regex = _compile_regx(year_regex, re.UNICODE)
+
+        # Default four digit year text always contains a digit, skip the year search of a
+        # string without one. Other year expressions may match years without a digit.
+        if ((year_regex.pattern == _FOUR_DIGIT_YEAR_REGX.pattern) and
+            (_DIGIT_REGX.search(year_string) is None)):
+            return
+
+        # Track the date text span in locals, store it once after the scan
+        int_years = self._intyears
+        first_start = -1
+        last_end = -1
+        for year_match in year_regex.finditer(year_string):
+            # Get the found year, convert a plain four digit year without a second search
+            year_text = year_match.group()
+            if (len(year_text) == 4) and year_text.isdecimal():
+                int_years.append(int(year_text))
+            else:
+                int_years.append(self._parse_year_from_date_str(year_text))
+
+            match_start, match_end = year_match.span()
+            if first_start == -1:
+                first_start = match_start
+            last_end = max(match_end, last_end)
 
-            if self._start == -1:
-                self._start = year_match.start() + base_index
-            self._end = max(year_match.end() + base_index, self._end)
+        if int_years:
+            self._start = first_start + base_index
+            self._end = last_end + base_index
 
     def _parse_year_from_date_str(self, year_str:str)->int:
         """!
@@ -106,7 +188,7 @@ class CopyrightYearsList():
         @param year_str {string} - Date string to convert
         @returns int - Year as a numeric value
         """
-        year_match = re.search(r'(\d{4})', year_str)
+        year_match = _FOUR_DIGIT_YEAR_REGX.search(year_str)
         if year_match is not None:
             int_year = int(year_match.group())
         else:
@@ -121,11 +203,11 @@ class CopyrightYearsList():
         """
         return bool(self._intyears)
 
-    def get_numeric_year_list(self)->list:
+    def get_numeric_year_list(self)->array.array:
         """!
         @brief Pull the numeric year data from the years list
 
-        @returns int[] - Numeric List of years
+        @returns array.array('i') - Numeric List of years, indexes and iterates like a list
         """
         return self._intyears
 
@@ -135,7 +217,7 @@ class CopyrightYearsList():
 
         @returns Entry 0 or None if the list is empty
         """
-        if len(self._intyears) > 0:
+        if self._intyears:
             return_data = self._intyears[0]
         else:
             return_data = None
@@ -147,7 +229,7 @@ class CopyrightYearsList():
 
         @returns Last year entry or None if the list is empty
         """
-        if len(self._intyears) > 0:
+        if self._intyears:
             return_data = self._intyears[-1]
         else:
             return_data = None
@@ -209,13 +291,13 @@ class CopyrightParse():
             regx_flags = re.UNICODE
 
         ## Regex expression for the copyright part of the copyright string
-        self.copyright_regx_msg = re.compile(copyright_search_msg, regx_flags)
+        self.copyright_regx_msg = _compile_regx(copyright_search_msg, regx_flags)
         ## Regex expression for the copyright tag of the copyright string
-        self.copyright_regx_tag = re.compile(copyright_search_tag, regx_flags)
+        self.copyright_regx_tag = _compile_regx(copyright_search_tag, regx_flags)
         ## Regex expression for the copyright year(s) of the copyright string
-        self.copyright_regx_year = re.compile(copyright_search_date, regx_flags)
+        self.copyright_regx_year = _compile_regx(copyright_search_date, regx_flags)
         ## Regex expression for the copyright owner text of the copyright string
-        self.copyright_regx_owner = re.compile(copyright_owner_spec, regx_flags)
+        self.copyright_regx_owner = _compile_regx(copyright_owner_spec, regx_flags)
 
         ## Copyright message valid flag. False until a valid copyright message is found
         self.copyright_text_valid = False
@@ -235,6 +317,50 @@ class CopyrightParse():
         ## criteria
         self.copyright_year_list = []
 
+    @property
+    def copyright_literals(self)->tuple:
+        """!
+        @brief Literal strings, one of which must be in a copyright line
+
+        @return tuple - Literal strings or None if the copyright_search_msg regex is not a
+                        list of literal alternatives
+        """
+        return self._get_literal_alternatives(self.copyright_regx_msg.pattern)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_literal_alternatives(search_regex:str)->tuple:
+        """!
+        @brief Split a regular expression made of literal alternatives into its literals
+
+        @param search_regex (string): Regular expression string
+
+        @return tuple - Literal alternative strings or None if any alternative is
+                        not a plain literal
+        """
+        literals = tuple(search_regex.split('|'))
+        for literal in literals:
+            if (not literal) or (re.escape(literal) != literal):
+                return None
+        return literals
+
+    def has_copyright_literal(self, test_string:str)->bool:
+        """!
+        @brief Cheap check run before is_copyright_line() to skip lines that can not
+               contain the copyright message word
+
+        @param test_string (string): Line of text to check
+
+        @return bool - False if the line can not be a copyright line, else True
+        """
+        literals = self.copyright_literals
+        if literals is None:
+            return True
+        for literal in literals:
+            if literal in test_string:
+                return True
+        return False
+
     def is_copyright_text_valid(self)->bool:
         """!
         @brief Determine if a previous parse was run and valid
@@ -269,8 +395,7 @@ class CopyrightParse():
         """
         return_status = False
         if self.copyright_text_valid:
-            self.copyright_text_owner += ", "
-            self.copyright_text_owner += new_owner
+            self.copyright_text_owner = ", ".join((self.copyright_text_owner, new_owner))
             return_status = True
 
         return return_status
@@ -310,7 +435,7 @@ class CopyrightParse():
         if eol_marker == '':
             eol_data = None
         else:
-            eol_start_index = base_index + re.search(r'[^ ]', test_string).start()
+            eol_start_index = base_index + _count_leading_spaces(test_string)
             eol_data = SubTextMarker(eol_marker, eol_start_index)
 
         return eol_data
@@ -331,11 +456,10 @@ class CopyrightParse():
         @return SubTextMarker object containing owner text data or
                 None if there is no valid owner string
         """
-        index = 0
-        while index < len(test_string):
-            if re.match(self.copyright_regx_owner, test_string[index]) is None:
-                break
-            index += 1
+        # Match the run of owner characters in a single scan instead of one match per character
+        owner_regx = self.copyright_regx_owner
+        owner_run_regx = _compile_regx("(?:"+owner_regx.pattern+")*", owner_regx.flags)
+        index = owner_run_regx.match(test_string).end()
 
         # Found end of owner, find start of owner string
         owner = test_string[:index]
@@ -344,7 +468,7 @@ class CopyrightParse():
         if owner == '':
             owner_data = None
         else:
-            owner_start_index = base_index + re.search(r'[^ ]', test_string[:index]).start()
+            owner_start_index = base_index + _count_leading_spaces(test_string)
             owner_data = SubTextMarker(owner, owner_start_index)
 
         return owner_data
@@ -369,8 +493,8 @@ class CopyrightParse():
         @return re.Match - Copyright tag match output or None if no match found
         @return CopyrightYearsList object - List of copyright year matches
         """
-        msg_marker = re.search(self.copyright_regx_msg, current_msg)
-        tag_marker = re.search(self.copyright_regx_tag, current_msg)
+        msg_marker = self.copyright_regx_msg.search(current_msg)
+        tag_marker = self.copyright_regx_tag.search(current_msg)
         year_list  = self._parse_years(current_msg)
 
         return msg_marker, tag_marker, year_list
@@ -456,14 +580,9 @@ class CopyrightParse():
         # Determine if eol text exists and should be added
         if self.copyright_text_eol is not None:
             eol_marker = self.copyright_text.rfind(self.copyright_text_eol)
-            pad_length = eol_marker - len(new_copyright_msg)
 
-            count = 0
-            while count < pad_length:
-                new_copyright_msg += " "
-                count+=1
-
-            new_copyright_msg += self.copyright_text_eol
+            # Pad the message with spaces to the original eol text position
+            new_copyright_msg = new_copyright_msg.ljust(eol_marker) + self.copyright_text_eol
 
         return new_copyright_msg
 
@@ -474,15 +593,7 @@ class CopyrightParse():
         @param last_modify_year (integer): File last modification date or None
         @return string : proper constructed year string
         """
-        if last_modify_year is not None:
-            if create_year == last_modify_year:
-                year_string = str(create_year)
-            else:
-                year_string = str(create_year)+"-"+str(last_modify_year)
-        else:
-            year_string = str(create_year)
-
-        return year_string
+        return _get_year_string(create_year, last_modify_year)
 
 class CopyrightParseOrder1(CopyrightParse):
     """!
@@ -501,22 +612,26 @@ class CopyrightParseOrder1(CopyrightParse):
         """
         match = False   # assume failure
 
-        # Get base components
-        msg_marker, tag_marker, year_list = self._parse_copyright_components(copyright_string)
-
-        # Get owner data
-        if year_list.is_valid():
-            end_of_dates = year_list.get_ending_string_index()
-            owner_data = self._parse_owner_string(copyright_string[end_of_dates:], end_of_dates)
-
-            # Check components
-            if self._check_components(msg_marker, tag_marker, year_list, owner_data):
-                # Check if the fields are in the correct order
-                if ((msg_marker.end() < tag_marker.start()) and
-                    (tag_marker.end() < year_list.get_starting_string_index()) and
-                    (end_of_dates < owner_data.start)):
-                    # Correct order
-                    match = True
+        # Reject lines with a missing or out of order message and tag before the
+        # more costly year and owner parsing
+        msg_marker = self.copyright_regx_msg.search(copyright_string)
+        if msg_marker is not None:
+            tag_marker = self.copyright_regx_tag.search(copyright_string)
+            if (tag_marker is not None) and (msg_marker.end() < tag_marker.start()):
+                year_list = self._parse_years(copyright_string)
+
+                # Get owner data
+                if year_list.is_valid():
+                    end_of_dates = year_list.get_ending_string_index()
+                    owner_data = self._parse_owner_string(copyright_string[end_of_dates:],
+                                                          end_of_dates)
+
+                    # Check components and the remaining field order
+                    if ((owner_data is not None) and
+                        (tag_marker.end() < year_list.get_starting_string_index()) and
+                        (end_of_dates < owner_data.start)):
+                        # Correct order
+                        match = True
 
         return match
 
@@ -560,12 +675,7 @@ class CopyrightParseOrder1(CopyrightParse):
         @return string : New copyright message
         """
         year_string = self._build_copyright_year_string(create_year, last_modify_year)
-        new_copyright_msg = copyright_msg_text+" "
-        new_copyright_msg += copyright_tag_text+" "
-        new_copyright_msg += year_string+" "
-        new_copyright_msg += owner
-
-        return new_copyright_msg
+        return " ".join((copyright_msg_text, copyright_tag_text, year_string, owner))
 
     def build_new_copyright_msg(self, create_year:int, last_modify_year:int = None,
                                 add_start_end:bool = False)->str:
@@ -580,22 +690,17 @@ class CopyrightParseOrder1(CopyrightParse):
         @return string : New copyright message or None if no copyright message was parsed
         """
         if self.copyright_text_valid:
-            # Determine if start of line text should be added
-            if add_start_end:
-                new_copyright_msg = self.copyright_text_start
-            else:
-                new_copyright_msg = ""
-
             # Output text in order
-            new_copyright_msg += self._create_copyright_msg(self.copyright_text_owner,
-                                                            self.copyright_text_msg,
-                                                            self.copyright_text_tag,
-                                                            create_year,
-                                                            last_modify_year)
+            new_copyright_msg = self._create_copyright_msg(self.copyright_text_owner,
+                                                           self.copyright_text_msg,
+                                                           self.copyright_text_tag,
+                                                           create_year,
+                                                           last_modify_year)
 
-            # Determine if eol text exists and should be added
+            # Determine if start of line and eol text should be added
             if add_start_end:
-                new_copyright_msg = self._add_eol_text(new_copyright_msg)
+                new_copyright_msg = self._add_eol_text(self.copyright_text_start +
+                                                       new_copyright_msg)
 
         else:
             new_copyright_msg = None
@@ -618,7 +723,7 @@ class CopyrightParseOrder2(CopyrightParse):
         @return int - Starting position from the start of the string where the owner
                           text might start
         """
-        owner_start = re.search(r'[a-zA-Z0-9]', copyright_string[:copyright_start])
+        owner_start = _ALPHANUMERIC_REGX.search(copyright_string, 0, copyright_start)
         if owner_start is not None:
             owner_str_start_index = owner_start.start()
         else:
@@ -634,25 +739,27 @@ class CopyrightParseOrder2(CopyrightParse):
         """
         match = False   # assume failure
 
-        # Get base components
-        msg_marker, tag_marker, year_list = self._parse_copyright_components(copyright_string)
-
-        # Get owner data
+        # Reject lines with a missing or out of order message and tag before the
+        # more costly year and owner parsing
+        msg_marker = self.copyright_regx_msg.search(copyright_string)
         if msg_marker is not None:
-            owner_str_start_index = self._find_owner_start(copyright_string, msg_marker.start())
-            owner_text = copyright_string[owner_str_start_index:msg_marker.start()]
-            owner_data = self._parse_owner_string(owner_text, owner_str_start_index)
-        else:
-            owner_data = None
-
-        # Check components
-        if self._check_components(msg_marker, tag_marker, year_list, owner_data):
-            # Check if the fields are in the correct order
-            if ((owner_data.start < msg_marker.start()) and
-                (msg_marker.end() < tag_marker.start()) and
-                (tag_marker.end() < year_list.get_starting_string_index())):
-                # Correct order
-                match = True
+            tag_marker = self.copyright_regx_tag.search(copyright_string)
+            if (tag_marker is not None) and (msg_marker.end() < tag_marker.start()):
+                year_list = self._parse_years(copyright_string)
+
+                # Get owner data
+                if ((year_list.is_valid()) and
+                    (tag_marker.end() < year_list.get_starting_string_index())):
+                    msg_start = msg_marker.start()
+                    owner_str_start_index = self._find_owner_start(copyright_string, msg_start)
+                    owner_data = self._parse_owner_string(
+                                        copyright_string[owner_str_start_index:msg_start],
+                                        owner_str_start_index)
+
+                    # Check the owner and the remaining field order
+                    if (owner_data is not None) and (owner_data.start < msg_start):
+                        # Correct order
+                        match = True
 
         return match
 
@@ -667,8 +774,9 @@ class CopyrightParseOrder2(CopyrightParse):
 
         # Get owner data
         if msg_marker is not None:
-            owner_str_start_index = self._find_owner_start(copyright_string, msg_marker.start())
-            owner_text = copyright_string[owner_str_start_index:msg_marker.start()]
+            msg_start = msg_marker.start()
+            owner_str_start_index = self._find_owner_start(copyright_string, msg_start)
+            owner_text = copyright_string[owner_str_start_index:msg_start]
             owner_data = self._parse_owner_string(owner_text, owner_str_start_index)
             sol_text = copyright_string[:owner_str_start_index]
         else:
@@ -701,12 +809,7 @@ class CopyrightParseOrder2(CopyrightParse):
         @return string : New copyright message
         """
         year_string = self._build_copyright_year_string(create_year, last_modify_year)
-        new_copyright_msg = owner+" "
-        new_copyright_msg += copyright_msg_text+" "
-        new_copyright_msg += copyright_tag_text+" "
-        new_copyright_msg += year_string
-
-        return new_copyright_msg
+        return " ".join((owner, copyright_msg_text, copyright_tag_text, year_string))
 
     def build_new_copyright_msg(self, create_year:int, last_modify_year:int = None,
                                 add_start_end:bool = False)->str:
@@ -721,22 +824,17 @@ class CopyrightParseOrder2(CopyrightParse):
         @return string : New copyright message or None if no copyright message was parsed
         """
         if self.copyright_text_valid:
-            # Determine if start of line text should be added
-            if add_start_end:
-                new_copyright_msg = self.copyright_text_start
-            else:
-                new_copyright_msg = ""
-
             # Output text in order
-            new_copyright_msg += self._create_copyright_msg(self.copyright_text_owner,
-                                                            self.copyright_text_msg,
-                                                            self.copyright_text_tag,
-                                                            create_year,
-                                                            last_modify_year)
+            new_copyright_msg = self._create_copyright_msg(self.copyright_text_owner,
+                                                           self.copyright_text_msg,
+                                                           self.copyright_text_tag,
+                                                           create_year,
+                                                           last_modify_year)
 
-            # Determine if eol text exists and should be added
+            # Determine if start of line and eol text should be added
             if add_start_end:
-                new_copyright_msg = self._add_eol_text(new_copyright_msg)
+                new_copyright_msg = self._add_eol_text(self.copyright_text_start +
+                                                       new_copyright_msg)
 
         else:
             new_copyright_msg = None
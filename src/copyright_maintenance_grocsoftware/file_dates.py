@@ -66,8 +66,8 @@ class GetFileSystemYears():
                            None if there was a conversion error
         """
         try:
-            local_date_struct = time.localtime(seconds)
-            return time.strftime("%Y", local_date_struct)
+            # Read the year field directly instead of formatting it with strftime()
+            return str(time.localtime(seconds).tm_year)
 
         except OverflowError:
             print("ERROR: Overflow error on conversion of time epoch.")
@@ -110,71 +110,140 @@ class GetGitArchiveFileYears():
         @brief Get the file creation year from the git archive
         @return str - creation year string or None if the git call failed
         """
-
-        # Get the date file was added to the archive
-        gitcmd = ["git", "log", "--diff-filter=A", "--format=%aI", self._file_path]
-
-        try:
-            git_start = subprocess.run(gitcmd, stdout=subprocess.PIPE,
-                                      stderr=subprocess.STDOUT, check=True)
-
-            start_output = git_start.stdout.decode('utf-8')
-            if git_start.returncode != 0:
-                print("ERROR: Git creation date failed: "+str(start_output))
-                ret_str = None
-            else:
-                ret_str = start_output[:4]
-            return ret_str
-        except subprocess.CalledProcessError:
-            print("ERROR: Git creation date command failed for file: "+self._file_path)
-            return None
+        return self.get_file_years()[0]
 
     def get_last_modification_year(self)->str:
         """!
         @brief Get the file last modification year from the git archive
         @return str - last modification year string or None if the git call failed
         """
-
-        # Get the date file was last modified in the archive
-        gitcmd = ["git", "log", "-1", "--format=%aI", self._file_path]
-
-        try:
-            gitmod = subprocess.run(gitcmd, stdout=subprocess.PIPE,
-                                    stderr=subprocess.STDOUT, check=True)
-
-            mod_output = gitmod.stdout.decode('utf-8')
-            if gitmod.returncode != 0:
-                print("ERROR: Git last modification date failed: "+str(mod_output))
-                ret_str = None
-            else:
-                ret_str = mod_output[:4]
-            return ret_str
-        except subprocess.CalledProcessError:
-            print("ERROR: Git last modification date command failed for file: "+self._file_path)
-            return None
+        return self.get_file_years()[1]
 
     def get_file_years(self)->tuple:
         """!
         @brief Get the file creation year and last modification n year
-        @return tuple - creation year string, last modification year string
+        @return tuple - creation year string, last modification year string or None, None
+                        if the git call failed
         """
-        # Get the date file was added to the archive
-        start_output = self.get_creation_year()
+        # Get all the file commit dates and change status, newest first, with a single
+        # git call. The creation year is the year of the newest commit that added the file
+        # to the archive, or of the oldest commit if no add commit is in the history.
+        gitcmd = ["git", "log", "--name-status", "--format=%aI", self._file_path]
         create_yr = None
         last_mod_yr = None
 
-        # Check for error
-        if start_output is not None:
-            # Get the date file was last modified in the archive
-            mod_output = self.get_last_modification_year()
+        try:
+            git_log = subprocess.run(gitcmd, stdout=subprocess.PIPE,
+                                     stderr=subprocess.STDOUT, check=True)
+
+            log_output = git_log.stdout.decode('utf-8')
+            if git_log.returncode != 0:
+                print("ERROR: Git file history failed: "+str(log_output))
+                return create_yr, last_mod_yr
+
+            commit_year = None
+            for log_line in log_output.splitlines():
+                if "\t" in log_line:
+                    # File change status line of the commit
+                    if (log_line[0] == "A") and (create_yr is None):
+                        create_yr = commit_year
+                elif log_line:
+                    commit_year = log_line[:4]
+                    if last_mod_yr is None:
+                        last_mod_yr = commit_year
 
-            # Check for error
-            if mod_output is not None:
-                create_yr = start_output
-                last_mod_yr = mod_output
+            if last_mod_yr is None:
+                print("ERROR: Git file history is empty for file: "+self._file_path)
+            elif create_yr is None:
+                create_yr = commit_year
+        except subprocess.CalledProcessError:
+            print("ERROR: Git file history command failed for file: "+self._file_path)
 
         return create_yr, last_mod_yr
 
+def _add_index_year(year_index:dict, file_path:str, commit_year:str, file_added:bool):
+    """!
+    @brief Add a commit of a file to the git archive year index, the commits are added
+           newest first
+
+    @param year_index (dictionary): {file path: [newest add year string or None, last
+                                    modification year string, oldest commit year string]}
+    @param file_path (string): Archive relative file path changed by the commit
+    @param commit_year (string): Commit year string
+    @param file_added (bool): True if the commit added the file to the archive
+    """
+    file_years = year_index.get(file_path)
+    if file_years is None:
+        # Newest commit of the file, last modification year
+        file_years = [None, commit_year, commit_year]
+        year_index[file_path] = file_years
+    else:
+        # Older commit of the file
+        file_years[2] = commit_year
+
+    if file_added and (file_years[0] is None):
+        file_years[0] = commit_year
+
+def _load_git_year_index()->dict:
+    """!
+    @brief Get the creation and last modification years of all the files in the git archive
+           with a single git log call. The creation year is the year of the newest commit
+           that added the file, or of the oldest commit if no add commit is in the history.
+
+    @return dictionary - {archive relative file path: (creation year string, last modification
+                         year string)}, empty if the git call failed
+    """
+    # NUL separated output so the file names are not quoted. Each commit starts with an
+    # empty field, then the commit date, then the change status and file name(s) of each
+    # commit file, newest commit first.
+    gitcmd = ["git", "log", "--name-status", "-z", "--format=%x00%aI"]
+    year_index = {}
+
+    try:
+        git_log = subprocess.run(gitcmd, stdout=subprocess.PIPE,
+                                 stderr=subprocess.STDOUT, check=True)
+    except subprocess.CalledProcessError:
+        debug_print(DBG_MSG_MINIMAL, "Git archive history command failed")
+        return year_index
+
+    if git_log.returncode != 0:
+        debug_print(DBG_MSG_MINIMAL, "Git archive history failed")
+        return year_index
+
+    commit_year = None
+    commit_start = False
+    change_status = None
+    path_count = 0
+    for log_field in git_log.stdout.decode('utf-8', 'surrogateescape').split("\0"):
+        if not log_field:
+            commit_start = True
+        elif commit_start:
+            commit_year = log_field[:4]
+            commit_start = False
+            path_count = 0
+        elif path_count == 0:
+            # Change status of the next file, the first one follows the line end of the
+            # commit date. Renames and copies list the old and the new file name.
+            change_status = log_field.lstrip("\n")[:1]
+            if change_status in ("R", "C"):
+                path_count = 2
+            else:
+                path_count = 1
+        else:
+            # The file name of an add, or the new file name of a rename or copy, is added
+            path_count -= 1
+            file_added = ((change_status == "A") or
+                          ((change_status in ("R", "C")) and (path_count == 0)))
+            _add_index_year(year_index, log_field, commit_year, file_added)
+
+    index_years = {}
+    for file_path, file_years in year_index.items():
+        if file_years[0] is None:
+            index_years[file_path] = (file_years[2], file_years[1])
+        else:
+            index_years[file_path] = (file_years[0], file_years[1])
+    return index_years
+
 def get_file_years(file_path:str)->tuple:
     """!
     @brief Get the file creation year and last modification n year
@@ -192,3 +261,27 @@ def get_file_years(file_path:str)->tuple:
     else:
         print("ERROR: File: \""+file_path+"\" does not exist or is not a file.")
     return create_yr, last_mod_yr
+
+def get_tree_file_years(file_paths):
+    """!
+    @brief Get the creation year and last modification year of a list of files. In a git
+           archive the years of all the files are read with a single git log call, files
+           that are not in it are queried one at a time with get_file_years().
+
+    @param file_paths (iterable of string): Path/Filenames of the files to fetch years from,
+                                            relative to or inside the current directory,
+                                            the top of the git archive
+
+    @return generator: (file path, (creation year string, last modification year string))
+                       tuples in the file_paths order
+    """
+    year_index = {}
+    if (os.path.exists(".git") and (os.path.isdir(".git"))):
+        year_index = _load_git_year_index()
+
+    for file_path in file_paths:
+        archive_path = os.path.relpath(file_path).replace(os.sep, "/")
+        file_years = year_index.get(archive_path)
+        if (file_years is None) or (not os.path.isfile(file_path)):
+            file_years = get_file_years(file_path)
+        yield file_path, file_years
@@ -0,0 +1,365 @@
+"""@package copyright_maintenance
+@brief Buffered file line reader
+Memory map or read a file and return each line with its file offset
+"""
+
+#==========================================================================
+# Copyright (c) 2026 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import mmap
+
+## Number of bytes requested from the file for each read
+READ_CHUNK_SIZE = 65536
+
+def open_for_scan(file_path:str):
+    """!
+    @brief Open a source file for reading with a READ_CHUNK_SIZE read buffer
+
+    @param file_path (string): Path and file name of the file to open
+
+    @return file object: Text mode file object open for reading
+    """
+    return open(file_path, "rt", encoding="utf-8", buffering=READ_CHUNK_SIZE)
+
+class FileLineReader():
+    """!
+    Iterate the lines of a file from the current file location.
+
+    The file is memory mapped, or read with a single read() if it can not be
+    mapped, and swept for the line ends with find(). Streams that can not seek
+    are read in READ_CHUNK_SIZE chunks. The file offset of each line is tracked
+    with a running counter instead of a tell() call per line. find_lines()
+    returns only the lines that contain one of a set of literal strings.
+
+    The binary sweep is only used for text mode files whose encoding stores a newline
+    as the single b"\n" byte (UTF-8, ASCII, Latin-1 ...) and whose data holds no
+    carriage return for the text layer to translate. Other text mode files, for example
+    UTF-16 or CRLF files, are read with the file readline() and tell() so the lines keep
+    the text layer decoding and universal newline translation.
+    """
+    __slots__ = ("_input_file", "_stream", "_encoding", "_errors", "_chunk_size",
+                 "_seekable", "_text_reads", "_mapped_file", "offset")
+
+    def __init__(self, input_file, chunk_size:int = READ_CHUNK_SIZE):
+        """!
+        @brief Constructor
+        @param input_file (file): Open file object to read the lines from
+        @param chunk_size (int): Number of bytes to request from the stream for each read
+                                 if the stream can not seek
+        """
+        ## File object the lines are read from
+        self._input_file = input_file
+        ## Binary stream underlying a text mode file object, else the file object
+        self._stream = getattr(input_file, "buffer", input_file)
+        ## Encoding used to decode the binary lines
+        self._encoding = getattr(input_file, "encoding", None) or "utf-8"
+        ## Decoding error handling scheme
+        self._errors = getattr(input_file, "errors", None) or "strict"
+        ## Number of bytes to request from the stream for each read
+        self._chunk_size = chunk_size
+        ## True if the file supports seek() and tell()
+        self._seekable = input_file.seekable()
+        ## True if the lines must be read with the text file readline()
+        self._text_reads = ((self._stream is not input_file) and
+                            ("\n".encode(self._encoding, self._errors) != b"\n"))
+        ## Memory map of the file while iterating or None
+        self._mapped_file = None
+        ## File offset of the start of the next unread line
+        self.offset = input_file.tell() if self._seekable else 0
+
+    def __iter__(self):
+        """!
+        @brief Read the lines from the starting offset to the end of the file
+
+        @return generator: (file offset of the line start, line text) tuples
+        """
+        if self._text_reads or (self._stream is not self._input_file and not self._seekable):
+            return self._read_text_lines()
+        if not self._seekable:
+            return self._read_chunk_lines()
+
+        self._mapped_file = self._map_file()
+        if self._mapped_file is not None:
+            if self._has_carriage_return(self._mapped_file, self.offset, None):
+                return self._read_text_lines()
+            return self._read_buffer_lines(self._mapped_file, self.offset)
+
+        # In memory or empty file, read the rest of it at once
+        self._stream.seek(self.offset)
+        file_data = self._stream.read()
+        if self._has_carriage_return(file_data, 0, None):
+            return self._read_text_lines()
+        return self._read_buffer_lines(file_data, 0)
+
+    def _map_file(self):
+        """!
+        @brief Memory map the file for reading
+
+        @return mmap.mmap: Read only file map or None if the file can not be mapped
+        """
+        try:
+            return mmap.mmap(self._stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # Not a file system file or an empty file
+            return None
+
+    def _has_carriage_return(self, file_data, data_start:int, end_offset:int)->bool:
+        """!
+        @brief Check the text mode file data for a carriage return the text layer would
+               translate, the binary sweep can not be used if one is found
+
+        @param file_data (mmap.mmap, bytes or string): File data to check
+        @param data_start (int): Index of the first unread byte in file_data
+        @param end_offset (int): File offset the scan ends at or None for the end of
+                                 the data, the line holding the end offset is checked
+
+        @return bool: True if the file lines must be read with the text file readline()
+        """
+        if (self._stream is self._input_file) or isinstance(file_data, str):
+            # Binary and in memory text streams do not translate the line ends
+            return False
+
+        data_end = len(file_data)
+        if end_offset is not None:
+            end_index = end_offset - self.offset + data_start
+            if end_index <= data_start:
+                return False
+            line_end = file_data.find(b"\n", min(end_index, data_end) - 1)
+            data_end = data_end if line_end == -1 else line_end + 1
+
+        if file_data.find(b"\r", data_start, data_end) == -1:
+            return False
+
+        # Release the file map, the text file reads the file itself
+        if self._mapped_file is not None:
+            self._mapped_file.close()
+            self._mapped_file = None
+        return True
+
+    def _read_text_lines(self):
+        """!
+        @brief Read the lines with the text file readline()
+
+        @return generator: (file offset of the line start, line text) tuples
+        """
+        if self._seekable:
+            self._input_file.seek(self.offset)
+        while True:
+            line = self._input_file.readline()
+            if not line:
+                break
+            line_offset = self.offset
+            if self._seekable:
+                self.offset = self._input_file.tell()
+            else:
+                self.offset += len(line.encode(self._encoding, self._errors))
+            yield line_offset, line
+
+    def _read_buffer_lines(self, file_data, line_start:int):
+        """!
+        @brief Sweep the file data for the line ends
+
+        @param file_data (mmap.mmap, bytes or string): File data to split into lines
+        @param line_start (int): Index of the first line in file_data
+
+        @return generator: (file offset of the line start, line text) tuples
+        """
+        newline = "\n" if isinstance(file_data, str) else b"\n"
+        data_end = len(file_data)
+        while line_start < data_end:
+            line_end = file_data.find(newline, line_start)
+            line_end = data_end if line_end == -1 else line_end + 1
+            yield self._next_line(file_data[line_start:line_end])
+            line_start = line_end
+
+    def _read_chunk_lines(self):
+        """!
+        @brief Read the stream in chunks and split the chunks into lines
+
+        @return generator: (file offset of the line start, line text) tuples
+        """
+        tail = None
+
+        while True:
+            chunk = self._stream.read(self._chunk_size)
+            if not chunk:
+                break
+            if tail:
+                chunk = tail + chunk
+
+            newline = "\n" if isinstance(chunk, str) else b"\n"
+            line_start = 0
+            line_end = chunk.find(newline)
+            while line_end != -1:
+                line_end += 1
+                yield self._next_line(chunk[line_start:line_end])
+                line_start = line_end
+                line_end = chunk.find(newline, line_start)
+
+            tail = chunk[line_start:]
+
+        # Last line of the stream without a line terminator
+        if tail:
+            yield self._next_line(tail)
+
+    def find_lines(self, literals:tuple = None, end_offset:int = None):
+        """!
+        @brief Read only the lines that contain one of the literal strings
+
+        The literals are located in the memory mapped file, or the search range read
+        with a single read(), with find() and only the lines holding a match are
+        extracted and decoded, the lines in between are never visited. Streams that
+        can not seek are read line by line and each line is checked.
+
+        @param literals (tuple): Literal strings to look for or None to return every line
+        @param end_offset (int): File offset to end the scan at or None to continue to
+                                 the end of the file. Lines starting at or after the
+                                 end_offset are not returned.
+
+        @return generator: (file offset of the line start, line text) tuples
+        """
+        if (literals is None) or (not self._seekable) or self._text_reads:
+            return self._filter_lines(literals, end_offset)
+
+        self._mapped_file = self._map_file()
+        if self._mapped_file is not None:
+            if self._has_carriage_return(self._mapped_file, self.offset, end_offset):
+                return self._filter_lines(literals, end_offset, self._read_text_lines())
+            return self._find_buffer_lines(self._mapped_file, self.offset, literals, end_offset)
+
+        # In memory or empty file, read the search range at once and search the data
+        self._stream.seek(self.offset)
+        if end_offset is None:
+            file_data = self._stream.read()
+        else:
+            file_data = self._stream.read(max(end_offset - self.offset, 0))
+            if file_data and (file_data[-1:] not in ("\n", b"\n")):
+                # Complete the line holding the end offset
+                file_data += self._stream.readline()
+        if self._has_carriage_return(file_data, 0, None):
+            return self._filter_lines(literals, end_offset, self._read_text_lines())
+        return self._find_buffer_lines(file_data, 0, literals, end_offset)
+
+    def _filter_lines(self, literals:tuple, end_offset:int, file_lines = None):
+        """!
+        @brief Read the lines and return the ones that contain one of the literal strings
+
+        @param literals (tuple): Literal strings to look for or None to return every line
+        @param end_offset (int): File offset to end the scan at or None
+        @param file_lines (generator): Line source or None to iterate the reader
+
+        @return generator: (file offset of the line start, line text) tuples
+        """
+        if file_lines is None:
+            file_lines = self
+        for line_offset, line in file_lines:
+            if (end_offset is not None) and (line_offset >= end_offset):
+                # Leave the line for the next read
+                self.offset = line_offset
+                break
+
+            if literals is None:
+                yield line_offset, line
+            else:
+                for literal in literals:
+                    if literal in line:
+                        yield line_offset, line
+                        break
+
+    def _find_buffer_lines(self, file_data, line_start:int, literals:tuple, end_offset:int):
+        """!
+        @brief Jump between the literal matches in the file data and return the
+               lines holding them
+
+        @param file_data (mmap.mmap, bytes or string): File data to search
+        @param line_start (int): Index of the first line in file_data
+        @param literals (tuple): Literal strings to look for
+        @param end_offset (int): File offset to end the scan at or None
+
+        @return generator: (file offset of the line start, line text) tuples
+        """
+        if isinstance(file_data, str):
+            newline = "\n"
+        else:
+            newline = b"\n"
+            literals = tuple(literal.encode(self._encoding, self._errors) for literal in literals)
+
+        # File offset of the first file data byte
+        data_offset = self.offset - line_start
+
+        # Search to the end of the line holding the last byte before the end_offset
+        search_end = len(file_data)
+        if end_offset is not None:
+            end_index = end_offset - data_offset
+            if end_index <= line_start:
+                search_end = line_start
+            elif end_index < search_end:
+                line_end = file_data.find(newline, end_index - 1)
+                search_end = search_end if line_end == -1 else line_end + 1
+
+        matches = [file_data.find(literal, line_start, search_end) for literal in literals]
+        while True:
+            match_start = min((index for index in matches if index != -1), default=-1)
+            if match_start == -1:
+                break
+
+            # Back up to the line start and forward to the line end
+            line_begin = file_data.rfind(newline, line_start, match_start)
+            line_begin = line_start if line_begin == -1 else line_begin + 1
+            line_start = file_data.find(newline, match_start, search_end)
+            line_start = search_end if line_start == -1 else line_start + 1
+
+            self.offset = data_offset + line_begin
+            yield self._next_line(file_data[line_begin:line_start])
+
+            # Find the next match of the literals found in the returned line
+            for index, match_index in enumerate(matches):
+                if match_index != -1 and match_index < line_start:
+                    matches[index] = file_data.find(literals[index], line_start, search_end)
+
+        # Leave the file at the end of the search
+        self.offset = data_offset + search_end
+
+    def _next_line(self, line_data)->tuple:
+        """!
+        @brief Advance the running offset past the input line
+
+        @param line_data (bytes or string): Line read from the file
+
+        @return tuple: (file offset of the line start, decoded line text)
+        """
+        line_offset = self.offset
+        self.offset += len(line_data)
+        if isinstance(line_data, bytes):
+            line_data = line_data.decode(self._encoding, self._errors)
+        return line_offset, line_data
+
+    def update_file_position(self):
+        """!
+        @brief Release the file map and move the file location to the start of
+               the next unread line
+        """
+        if self._mapped_file is not None:
+            self._mapped_file.close()
+            self._mapped_file = None
+        if self._seekable:
+            self._input_file.seek(self.offset)
@@ -28,6 +28,8 @@ Scan the source files and update the copyright year in the header section of any
 import datetime
 
 from copyright_maintenance_grocsoftware.file_dates import get_file_years
+from copyright_maintenance_grocsoftware.file_dates import get_tree_file_years
+from copyright_maintenance_grocsoftware.line_reader import open_for_scan
 from copyright_maintenance_grocsoftware.oscmdshell import get_command_shell
 
 from copyright_maintenance_grocsoftware.copyright_tools import CopyrightParseEnglish
@@ -41,6 +43,8 @@ class CopyrightCommentBlock(CommentBlock):
     Identify the start and end of a comment blocks and determine if the
     copyright message is in the block(s)
     """
+    __slots__ = ("_copyright_finder", "input_file", "_copyright_block_data")
+
     def __init__(self, input_file,
                  comment_markers:dict = None,
                  copyright_parser = None):
@@ -58,10 +62,9 @@ class CopyrightCommentBlock(CommentBlock):
         """
         super().__init__(input_file, comment_markers)
 
-        ## Copyright parser object to use for generation
-        self._copyright_parser = CopyrightParseEnglish()
-        if copyright_parser is not None:
-            self._copyright_parser = copyright_parser
+        ## Copyright message finder, shared by all the comment block checks. Uses the
+        ## shared default parser if copyright_parser is None
+        self._copyright_finder = CopyrightFinder(copyright_parser)
 
         ## File to parse and look for the copyright message
         self.input_file = input_file
@@ -83,10 +86,9 @@ class CopyrightCommentBlock(CommentBlock):
         """
         if (comment_blk_strt_off is not None) and (comment_blk_end_off is not None):
             self.input_file.seek(comment_blk_strt_off)
-            copyright_finder = CopyrightFinder(self._copyright_parser)
-            status, data = copyright_finder.find_next_copyright_msg(self.input_file,
-                                                                    comment_blk_strt_off,
-                                                                    comment_blk_end_off)
+            status, data = self._copyright_finder.find_next_copyright_msg(self.input_file,
+                                                                          comment_blk_strt_off,
+                                                                          comment_blk_end_off)
         else:
             status = False
             data = None
@@ -160,13 +162,18 @@ class CopyrightCommentBlock(CommentBlock):
         return self._copyright_block_data
 
 
-def update_copyright_years(filename:str):
+def update_copyright_years(filename:str, file_years:tuple = None):
     """!
     @brief Update the copyright years in the copyright message of the input file
 
     @param filename(string): path and name of file to update
+    @param file_years(tuple): Creation year string and last modification year string of
+                              the file if already known, or None to get them with
+                              get_file_years()
     """
-    creation_year_str, modify_year_str = get_file_years(filename)
+    if file_years is None:
+        file_years = get_file_years(filename)
+    creation_year_str, modify_year_str = file_years
 
     if creation_year_str is None:
         print ("None returned from get_file_years() for creation year")
@@ -180,7 +187,7 @@ def update_copyright_years(filename:str):
     else:
         modification_year = int(modify_year_str)
 
-    with open(filename, "rt", encoding="utf-8") as testfile:
+    with open_for_scan(filename) as testfile:
         # Get a copyright message parser and comment block parser
         copyright_parser = CopyrightParseEnglish()
         copyright_generator = CopyrightGenerator(copyright_parser)
@@ -197,6 +204,18 @@ def update_copyright_years(filename:str):
 
             # Get the new message
             msg_changed, new_msg = copyright_generator.get_new_copyright_msg(creation_year,
-                                                                             modification_year)
+                                                                             modification_year,
+                                                                             old_msg)
             if msg_changed:
                 get_command_shell().stream_edit(filename, old_msg, new_msg)
+
+def update_tree_copyright_years(file_paths):
+    """!
+    @brief Update the copyright years in the copyright message of each of the input files.
+           The file years are read for all the files at once, with a single git log call
+           in a git archive.
+
+    @param file_paths (iterable of string): path and name of the files to update
+    """
+    for file_path, file_years in get_tree_file_years(file_paths):
+        update_copyright_years(file_path, file_years)
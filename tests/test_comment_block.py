@@ -25,6 +25,7 @@ Unittest for copyright maintenance utility
 #==========================================================================
 
 import os
+import pytest
 
 from copyright_maintenance_grocsoftware.comment_block import CommentBlock
 from copyright_maintenance_grocsoftware.comment_block import TextFileCommentBlock
@@ -66,6 +67,20 @@ def test02_empty_file_comment_block():
         block_parser = TextFileCommentBlock(testfile)
         assert not block_parser.find_next_comment_block()
 
+def test03_blank_line_whitespace_check():
+    """!
+    @brief Test the blank line check matches the regex \\S non-white space definition
+    """
+    block_parser = TextFileCommentBlock(None)
+    for blank_line in ["", "\n", " \t\r\n", "\f\v\n", "  　\n", "\x1c\x1f\n"]:
+        assert not block_parser.is_current_line_comment_start(blank_line)
+
+    assert block_parser.is_current_line_comment_start(" text\n")
+    for blank_line in ["", "\n", " \t\r\n", "  　\n"]:
+        assert not block_parser.is_current_line_comment_start("text\n")
+        assert block_parser.is_current_line_comment_end(blank_line)
+        assert block_parser.is_current_line_comment_start("text\n")
+
 # Unit test for the TextFileCommentBlock class
 
 def test_comment_blockid():
@@ -97,6 +112,30 @@ def test_comment_blockid():
     comment_markers = CommentParams.get_comment_markers("testfile.")
     assert comment_markers is None
 
+def test_comment_blockid_read_only():
+    """!
+    @brief Test that the comment marker tables can not be modified
+    """
+    comment_markers = CommentParams.get_comment_markers("testfile.c")
+    with pytest.raises(TypeError):
+        comment_markers['blockStart'] = "#"
+    with pytest.raises(TypeError):
+        CommentParams.commentBlockDelim['.x'] = comment_markers
+    assert CommentParams.get_comment_markers("testfile.c")['blockStart'] == "/*"
+
+def test_comment_block_start_markers():
+    """!
+    @brief Test the start markers are built once per comment marker set
+    """
+    # pylint: disable=protected-access
+    c_block = CommentBlock(None, CommentParams.get_comment_markers("testfile.c"))
+    cpp_block = CommentBlock(None, CommentParams.get_comment_markers("testfile.cpp"))
+    sh_block = CommentBlock(None, CommentParams.get_comment_markers("testfile.sh"))
+    assert c_block._start_markers == ("/*", "//")
+    assert c_block._start_markers is cpp_block._start_markers
+    assert sh_block._start_markers == ("#",)
+    assert not CommentBlock(None, None)._start_markers
+
 # Unit test for the CommentBlock class c, cpp, h, hpp file case
 
 def test_c_file_comment_block():
@@ -258,3 +297,43 @@ def test_bat_file_comment_block():
         assert block_parser.comment_blk_eol_off == 160
 
         assert not block_parser.find_next_comment_block()
+
+# Unit test for the CommentBlock class unknown file type case
+
+def test_no_markers_comment_block():
+    """!
+    @brief Test no comment block is found and the file is not read without comment markers
+    """
+    testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.c")
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        block_parser = CommentBlock(testfile, None)
+        assert not block_parser.find_next_comment_block()
+        assert block_parser.comment_blk_strt_off is None
+        assert block_parser.comment_blk_eol_off is None
+        assert testfile.tell() == 0
+
+def test_multibyte_file_comment_block(tmp_path):
+    """!
+    @brief Test the comment block offsets are byte offsets with multi-byte characters
+    """
+    test_text = "/* Copyright © 2024 Me\n */\n// Zoë\n// line 2\nint x;\n"
+    testfile_path = tmp_path / "multibyte.c"
+    testfile_path.write_text(test_text, encoding="utf-8")
+    test_bytes = test_text.encode("utf-8")
+
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        block_parser = CommentBlock(testfile, CommentParams.get_comment_markers("multibyte.c"))
+        assert block_parser.find_next_comment_block()
+        assert block_parser.comment_blk_strt_off == 0
+        assert block_parser.comment_blk_eol_off == test_bytes.index(b"//")
+
+        assert block_parser.find_next_comment_block()
+        assert block_parser.comment_blk_strt_off == test_bytes.index(b"//")
+        assert block_parser.comment_blk_sol_off == test_bytes.index(b"// line 2")
+        assert block_parser.comment_blk_eol_off == test_bytes.index(b"int")
+
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        block_parser = TextFileCommentBlock(testfile)
+        assert block_parser.find_next_comment_block()
+        assert block_parser.comment_blk_strt_off == 0
+        assert block_parser.comment_blk_eol_off == len(test_bytes)
@@ -25,6 +25,8 @@ Unittest for copyright maintenance utility
 
 from copyright_maintenance_grocsoftware.copyright_tools import CopyrightParseOrder1
 from copyright_maintenance_grocsoftware.copyright_tools import CopyrightParseOrder2
+from copyright_maintenance_grocsoftware.copyright_parse_set import CopyrightParseSet
+from copyright_maintenance_grocsoftware.copyright_parse_set import scan_lines
 
 # pylint: disable=protected-access
 
@@ -182,6 +184,20 @@ def test1008_build_new_msg_no_parse():
     return_str = test_parser.build_new_copyright_msg(2023, 2024, True)
     assert return_str is None
 
+def test1009_scan_lines():
+    """!
+    @brief Test the scan_lines() function
+    """
+    test_parser = setup_order1()
+    test_lines = ["#!/usr/bin/env python\n",
+                  "# Copyright (c) 2022 Scott Summers\n",
+                  "# Copyright notice follows\n",
+                  "import os\n",
+                  "# COPYRIGHT (C) 2023-2024 Jean Grey\n"]
+    assert list(scan_lines(test_parser, test_lines)) == [(1, test_lines[1]),
+                                                         (4, test_lines[4])]
+    assert not list(scan_lines(test_parser, test_lines[2:4]))
+
 # Unit test for the copyright parser order1 class
 
 def setup_order2():
@@ -359,3 +375,58 @@ def test2009_build_new_msg_no_parse():
 
     return_str = test_parser.build_new_copyright_msg(2023, 2024, True)
     assert return_str is None
+
+def test3001_parse_set_literals():
+    """!
+    @brief Test the combined copyright word literals of a parser set
+    """
+    test_parser_set = CopyrightParseSet([setup_order1(), setup_order2()])
+    assert test_parser_set.copyright_literals == ("Copyright", "COPYRIGHT", "copyright")
+
+    test_parser = CopyrightParseOrder1(copyright_search_msg = r'Droits|DROITS',
+                                       copyright_search_tag = r'\([cC]\)',
+                                       copyright_search_date = r'(\d{4})',
+                                       copyright_owner_spec = r'[a-zA-Z0-9,\./\- @]')
+    test_parser_set = CopyrightParseSet([setup_order1(), test_parser])
+    assert test_parser_set.copyright_literals == ("Copyright", "COPYRIGHT", "copyright",
+                                                  "Droits", "DROITS")
+    assert test_parser_set.has_copyright_literal("# Droits (c) 2024 Owner")
+    assert not test_parser_set.has_copyright_literal("import os")
+
+    test_parser = CopyrightParseOrder1(copyright_search_msg = r'[Cc]opyright',
+                                       copyright_search_tag = r'\([cC]\)',
+                                       copyright_search_date = r'(\d{4})',
+                                       copyright_owner_spec = r'[a-zA-Z0-9,\./\- @]')
+    test_parser_set = CopyrightParseSet([setup_order1(), test_parser])
+    assert test_parser_set.copyright_literals is None
+
+def test3002_parse_set_is_copyright_line():
+    """!
+    @brief Test the parser set dispatches the line to the matching parser
+    """
+    order1_parser = setup_order1()
+    order2_parser = setup_order2()
+    test_parser_set = CopyrightParseSet([order1_parser, order2_parser])
+
+    assert test_parser_set.is_copyright_line("Copyright (c) 2024 Scott Summers")
+    assert test_parser_set.get_matching_parser("Copyright (c) 2024 Scott Summers") is \
+           order1_parser
+
+    assert test_parser_set.is_copyright_line("Scott Summers Copyright (c) 2024")
+    assert test_parser_set.get_matching_parser("Scott Summers Copyright (c) 2024") is \
+           order2_parser
+
+    assert not test_parser_set.is_copyright_line("Scott Summers (c) 2024")
+    assert test_parser_set.get_matching_parser("Scott Summers (c) 2024") is None
+
+    # Each found line is parsed with its own matching parser
+    found_lines = list(scan_lines(test_parser_set, ["Copyright (c) 2021 Scott Summers",
+                                                    "import os",
+                                                    "Jean Grey Copyright (c) 2022"]))
+    assert [line_index for line_index, _ in found_lines] == [0, 2]
+    for _, found_line in found_lines:
+        matching_parser = test_parser_set.get_matching_parser(found_line)
+        matching_parser.parse_copyright_msg(found_line)
+        assert matching_parser.copyright_text_valid
+    assert order1_parser.get_copyright_dates() == [2021]
+    assert order2_parser.get_copyright_dates() == [2022]
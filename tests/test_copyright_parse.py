@@ -28,6 +28,9 @@ import os
 from copyright_maintenance_grocsoftware.copyright_tools import CopyrightParseEnglish
 from copyright_maintenance_grocsoftware.copyright_generator import CopyrightGenerator
 from copyright_maintenance_grocsoftware.copyright_finder import CopyrightFinder
+from copyright_maintenance_grocsoftware.copyright_finder import scan_paths
+from copyright_maintenance_grocsoftware.copyright_finder import scan_tree
+from copyright_maintenance_grocsoftware.copyright_finder import _scan_one
 
 from tests.dir_init import TEST_FILE_PATH
 TEST_FILE_BASE_DIR = TEST_FILE_PATH
@@ -58,14 +61,6 @@ class TestClass07CopyrightGenerator:
     """!
     @brief Unit test for the copyright generator class
     """
-    def test000_copyright_generation_is_multi_year(self):
-        """!
-        @brief Test the parser of _is_multi_year()
-        """
-        assert not CopyrightGenerator._is_multi_year(2022, None)
-        assert not CopyrightGenerator._is_multi_year(2022, 2022)
-        assert CopyrightGenerator._is_multi_year(2022, 2023)
-
     def test001_copyright_default_generation(self):
         """!
         @brief Test the parser of get_new_copyright_msg()
@@ -196,6 +191,15 @@ class TestClass07CopyrightGenerator:
         assert not changed
         assert new_msg == copyright_msg
 
+        # Caller supplied current text
+        changed, new_msg = test_generator.get_new_copyright_msg(2022, 2024, "current text")
+        assert not changed
+        assert new_msg == "current text"
+
+        changed, new_msg = test_generator.get_new_copyright_msg(2022, 2025, "current text")
+        assert changed
+        assert new_msg == "Copyright (C) 2022-2025 Scott Summers"
+
     def test006_copyright_normal_generation_change(self):
         """!
         @brief Test the parser of get_new_copyright_msg() with valid message and default regx
@@ -467,3 +471,139 @@ class TestClass08CopyrightFind:
             assert len(location_dict_list) == 1
             assert location_dict_list[0]['lineOffset'] == 3
             assert location_dict_list[0]['text'] == ' Copyright (c) 2022-2024 Randal Eike\n'
+
+    def test012_find_copyright_file_position(self):
+        """!
+        @brief Test find_next_copyright_msg() leaves the file at the line following the
+               copyright message
+        """
+        testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.py")
+        with open(testfile_path, "rt", encoding="utf-8") as testfile:
+            test_finder = CopyrightFinder()
+            copyright_found, location_dict = test_finder.find_copyright_msg(testfile)
+            assert copyright_found
+            assert testfile.tell() == location_dict['lineOffset'] + len(location_dict['text'])
+
+    def test013_find_copyright_head_scan(self, tmp_path):
+        """!
+        @brief Test find_copyright_msg() only scans the file head if exhaustive is cleared
+        """
+        copyright_line = "# Copyright (c) 2024 Randal Eike\n"
+        testfile_path = tmp_path / "testfile_long.py"
+        testfile_path.write_text(("#" * 79 + "\n") * 200 + copyright_line, encoding="utf-8")
+
+        with open(testfile_path, "rt", encoding="utf-8") as testfile:
+            test_finder = CopyrightFinder()
+            copyright_found, location_dict = test_finder.find_copyright_msg(testfile, False)
+            assert not copyright_found
+            assert location_dict is None
+
+            copyright_found, location_dict = test_finder.find_copyright_msg(testfile)
+            assert copyright_found
+            assert location_dict['lineOffset'] == 80 * 200
+            assert location_dict['text'] == copyright_line
+
+    def test014_scan_paths(self):
+        """!
+        @brief Test scan_paths() returns the find_all_copyright_msg() results of each file
+        """
+        test_files = [os.path.join(TEST_FILE_BASE_DIR, file_name)
+                      for file_name in ("testfile.c", "testfile_nomsg.py", "testfile.py")]
+        scan_results = list(scan_paths(test_files, 2))
+
+        assert [file_path for file_path, _ in scan_results] == test_files
+        for file_path, copyright_dict_list in scan_results:
+            with open(file_path, "rt", encoding="utf-8") as testfile:
+                _, expected_list = CopyrightFinder().find_all_copyright_msg(testfile)
+            assert copyright_dict_list == expected_list
+        assert scan_results[1][1] is None
+
+    def test015_finder_slots(self):
+        """!
+        @brief Test the finder and generator objects have no instance dictionary
+        """
+        assert not hasattr(CopyrightFinder(), "__dict__")
+        assert not hasattr(CopyrightGenerator(), "__dict__")
+
+    def test016_find_all_copyright_multiple(self, tmp_path):
+        """!
+        @brief Test find_all_copyright_msg() with multiple copyright lines and multi-byte text
+        """
+        copyright_line1 = "# © Copyright (c) 2022 Scott Summers\n"
+        copyright_line2 = "# Copyright (c) 2024 Jean Grey\n"
+        testfile_path = tmp_path / "testfile_multi.py"
+        testfile_path.write_text("#!/usr/bin/env python\n" + copyright_line1 +
+                                 copyright_line2 + "import os\n", encoding="utf-8")
+
+        with open(testfile_path, "rt", encoding="utf-8") as testfile:
+            test_finder = CopyrightFinder()
+            copyright_found, location_dict_list = test_finder.find_all_copyright_msg(testfile)
+            assert copyright_found
+            assert location_dict_list == [{'lineOffset': 22, 'text': copyright_line1},
+                                          {'lineOffset': 22 + len(copyright_line1.encode()),
+                                           'text': copyright_line2}]
+
+    def test017_find_copyright_binary_file(self):
+        """!
+        @brief Test the finder results are the same for a binary mode file
+        """
+        testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.c")
+        with open(testfile_path, "rb") as testfile:
+            test_finder = CopyrightFinder()
+            copyright_found, location_dict_list = test_finder.find_all_copyright_msg(testfile)
+            assert copyright_found
+            assert location_dict_list == [{'lineOffset': 3,
+                                           'text': ' Copyright (c) 2022-2024 Randal Eike\n'}]
+
+    def test018_finder_default_parser_shared(self):
+        """!
+        @brief Test the finders share the default parser and the generators do not
+        """
+        assert CopyrightFinder()._parser is CopyrightFinder()._parser
+        assert CopyrightGenerator().parser is not CopyrightGenerator().parser
+
+    def test019_scan_tree(self, tmp_path):
+        """!
+        @brief Test scan_tree() scans the tree files and skips hidden directories
+        """
+        copyright_line = "# Copyright (c) 2024 Scott Summers\n"
+        (tmp_path / "sub").mkdir()
+        (tmp_path / ".hidden").mkdir()
+        (tmp_path / "a.py").write_text(copyright_line, encoding="utf-8")
+        (tmp_path / "sub" / "b.py").write_text("import os\n", encoding="utf-8")
+        (tmp_path / ".hidden" / "c.py").write_text(copyright_line, encoding="utf-8")
+
+        scan_results = list(scan_tree(str(tmp_path), 1))
+        assert scan_results == [(str(tmp_path / "a.py"), [{'lineOffset': 0,
+                                                           'text': copyright_line}]),
+                                (str(tmp_path / "sub" / "b.py"), None)]
+
+class TestClass09CopyrightScan:
+    """!
+    @brief Unit test for the copyright scan worker functions
+    """
+    def test001_scan_one_unreadable_file(self, tmp_path):
+        """!
+        @brief Test _scan_one() returns None for binary and missing files
+        """
+        copyright_line = "// Copyright (c) 2020 Scott Summers\n"
+        (tmp_path / "a.c").write_text(copyright_line, encoding="utf-8")
+        (tmp_path / "blob.bin").write_bytes(b'\xff\xfe Copyright (c) 2020 \xff\n')
+
+        assert _scan_one(str(tmp_path / "a.c")) == [{'lineOffset': 0, 'text': copyright_line}]
+        assert _scan_one(str(tmp_path / "blob.bin")) is None
+        assert _scan_one(str(tmp_path / "missing.c")) is None
+
+    def test002_scan_tree_unreadable_file(self, tmp_path):
+        """!
+        @brief Test a binary file does not end the scan_tree() scan
+        """
+        copyright_line = "// Copyright (c) 2020 Scott Summers\n"
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.c").write_text(copyright_line, encoding="utf-8")
+        (tmp_path / "sub" / "blob.bin").write_bytes(b'\xff\xfe Copyright (c) 2020 \xff\n')
+
+        scan_results = list(scan_tree(str(tmp_path), 1))
+        assert scan_results == [(str(tmp_path / "a.c"), [{'lineOffset': 0,
+                                                          'text': copyright_line}]),
+                                (str(tmp_path / "sub" / "blob.bin"), None)]
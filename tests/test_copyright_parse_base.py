@@ -184,6 +184,13 @@ class TestClass01CopyrightParserBase:
             assert text_marker.start == 16
             assert text_marker.end == 16+len(owner)
 
+            # Owner text ends at the first character that is not an owner character
+            text_marker = self.test_parser._parse_owner_string(" "+owner+"; "+owner, 15)
+            assert text_marker is not None
+            assert text_marker.text == owner
+            assert text_marker.start == 16
+            assert text_marker.end == 16+len(owner)
+
     def test009_copyright_parse_years(self):
         """!
         @brief Test the parse years
@@ -334,6 +341,57 @@ class TestClass01CopyrightParserBase:
         year_str = self.test_parser._build_copyright_year_string(2022,2024)
         assert year_str == "2022-2024"
 
+    def test015_copyright_literals(self):
+        """!
+        @brief Test the copyright message literal prefilter
+        """
+        assert self.test_parser.copyright_literals == ("Copyright", "COPYRIGHT", "copyright")
+        assert self.test_parser.has_copyright_literal(" * Copyright (c) 2024 owner")
+        assert self.test_parser.has_copyright_literal("# COPYRIGHT (c) 2024 owner")
+        assert not self.test_parser.has_copyright_literal("int main(void)")
+        assert not self.test_parser.has_copyright_literal(" Copy right (c) 2024 owner")
+
+    def test016_copyright_literals_not_literal(self):
+        """!
+        @brief Test the copyright message literal prefilter is disabled for non-literal regex
+        """
+        assert CopyrightParse._get_literal_alternatives(r'[Cc]opyright') is None
+        assert CopyrightParse._get_literal_alternatives(r'Copyright|') is None
+        assert CopyrightParse._get_literal_alternatives(r'Copr\.|Copyright') is None
+
+        test_parser = CopyrightParse(copyright_search_msg = r'[Cc]opyright',
+                                     copyright_search_tag = r'\([cC]\)',
+                                     copyright_search_date = r'(\d{4})',
+                                     copyright_owner_spec = r'[a-zA-Z0-9,\./\- @]')
+        assert test_parser.copyright_literals is None
+        assert test_parser.has_copyright_literal("int main(void)")
+
+    def test017_compiled_regx_shared(self):
+        """!
+        @brief Test parsers with the same search strings share the compiled expressions
+        """
+        test_parser = CopyrightParse(copyright_search_msg = r'Copyright|COPYRIGHT|copyright',
+                                     copyright_search_tag = r'\([cC]\)',
+                                     copyright_search_date = r'(\d{4})',
+                                     copyright_owner_spec = r'[a-zA-Z0-9,\./\- @]')
+        assert test_parser.copyright_regx_msg is self.test_parser.copyright_regx_msg
+        assert test_parser.copyright_regx_tag is self.test_parser.copyright_regx_tag
+        assert test_parser.copyright_regx_year is self.test_parser.copyright_regx_year
+        assert test_parser.copyright_regx_owner is self.test_parser.copyright_regx_owner
+
+    def test018_sub_text_marker_trim(self):
+        """!
+        @brief Test the SubTextMarker text trim and location values
+        """
+        for new_text, text, start in (("Owner", "Owner", 10), ("  Owner ", "Owner", 12),
+                                      ("\tOwner\n", "Owner", 11), ("   ", "", 13),
+                                      ("", "", 10)):
+            text_marker = SubTextMarker(new_text, 10)
+            assert text_marker.get_text() == text
+            assert text_marker.get_start() == start
+            assert text_marker.get_end() == start + len(text)
+            assert not hasattr(text_marker, "__dict__")
+
 class TestClass02CopyrightParserBase:
     """!
     Test the base copyright parsing functionality
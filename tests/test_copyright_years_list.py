@@ -123,3 +123,23 @@ class TestClass01CopyrightYearParser:
         assert year_parser._parse_year_from_date_str("14-mar-2023") == 2023
         assert year_parser._parse_year_from_date_str("03/14/2021") == 2021
         assert year_parser._parse_year_from_date_str("03/14") == 1970
+
+    def test007_parse_no_instance_dict(self):
+        """!
+        @brief Test the year list objects have no instance dictionary
+        """
+        year_regex = re.compile(r'(\d{4})')
+        assert not hasattr(CopyrightYearsList(" 2024 ", year_regex), "__dict__")
+
+    def test008_parse_year_regex_without_digits(self):
+        """!
+        @brief Test a user year regex that matches years without an ASCII digit
+        """
+        year_parser = CopyrightYearsList(" MMXXIV ", re.compile(r'(MM[CDLXVI]*)'))
+        assert year_parser.is_valid()
+        assert year_parser.get_starting_string_index() == 1
+        assert year_parser.get_ending_string_index() == 7
+
+        year_parser = CopyrightYearsList(" ２０２４ ", re.compile(r'(\d{4})'))
+        assert year_parser.is_valid()
+        assert list(year_parser.get_numeric_year_list()) == [2024]
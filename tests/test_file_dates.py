@@ -37,6 +37,7 @@ from copyright_maintenance_grocsoftware.file_dates import debug_print
 from copyright_maintenance_grocsoftware.file_dates import GetFileSystemYears
 from copyright_maintenance_grocsoftware.file_dates import GetGitArchiveFileYears
 from copyright_maintenance_grocsoftware.file_dates import get_file_years
+from copyright_maintenance_grocsoftware.file_dates import get_tree_file_years
 
 TEST_FILE_BASE_DIR = TEST_FILE_PATH
 
@@ -145,7 +146,7 @@ def test009_get_creation_year_git_fail(capsys):
         test_obj = GetGitArchiveFileYears("testfile")
         year = test_obj.get_creation_year()
         assert year is None
-        assert capsys.readouterr().out == "ERROR: Git creation date failed: git error msg\n"
+        assert capsys.readouterr().out == "ERROR: Git file history failed: git error msg\n"
 
 def test010_get_creation_year_system_failure(capsys):
     """!
@@ -158,7 +159,7 @@ def test010_get_creation_year_system_failure(capsys):
         test_obj = GetGitArchiveFileYears("testfile")
         year = test_obj.get_creation_year()
         assert year is None
-        assert capsys.readouterr().out == "ERROR: Git creation date command failed for " \
+        assert capsys.readouterr().out == "ERROR: Git file history command failed for " \
                                           "file: testfile\n"
 
 def test011_get_last_mod_year_pass():
@@ -186,8 +187,7 @@ def test012_get_last_mod_year_git_fail(capsys):
         test_obj = GetGitArchiveFileYears("testfile")
         year = test_obj.get_last_modification_year()
         assert year is None
-        assert capsys.readouterr().out == "ERROR: Git last modification date failed: " \
-                                    "git error msg\n"
+        assert capsys.readouterr().out == "ERROR: Git file history failed: git error msg\n"
 
 def test013_get_last_mod_year_system_failure(capsys):
     """!
@@ -199,161 +199,60 @@ def test013_get_last_mod_year_system_failure(capsys):
         test_obj = GetGitArchiveFileYears("testfile")
         year = test_obj.get_last_modification_year()
         assert year is None
-        assert capsys.readouterr().out == "ERROR: Git last modification date command failed " \
-                                          "for file: testfile\n"
+        assert capsys.readouterr().out == "ERROR: Git file history command failed for " \
+                                          "file: testfile\n"
 
 def test014_get_years_pass():
     """!
     Test get_file_years(), Git pass
     """
-    # pylint: disable=unused-argument
-    # pylint: disable=too-many-arguments
-    # pylint: disable=too-many-locals
-    def mockrun(args, *, stdin=None,
-                    inputstd=None, stdout=None,
-                    stderr=None, capture_output=False,
-                    shell=False, cwd=None,
-                    timeout=None, check=False,
-                    encoding=None, errors=None,
-                    text=None, env=None, universal_newlines=None,
-                    **other_popen_kwargs):
-
-        git_cmd = ""
-        prefix = ""
-        for element in args:
-            git_cmd += prefix
-            git_cmd += element
-            prefix = " "
-
-        ret_code = None
-        if args[2] == "-1":
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               0,
-                                               "2024-01-01T12:00:00-06:00".encode('utf-8'),
-                                               "")
-        elif args[2] == "--diff-filter=A":
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               0,
-                                               "2023-01-01T12:00:00-06:00".encode('utf-8'),
-                                               "")
-        else:
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               2,
-                                               "Git error".encode('utf-8'),
-                                               "")
-        return ret_code
-    # pylint: enable=unused-argument
-    # pylint: enable=too-many-arguments
-
-    with patch('subprocess.run', MagicMock(side_effect = mockrun)):
+    ret_code_pass = subprocess.CompletedProcess("git",
+                                                0,
+                                                ("2024-01-01T12:00:00-06:00\n\n"
+                                                 "M\ttestfile\n"
+                                                 "2023-06-01T12:00:00-06:00\n\n"
+                                                 "A\ttestfile\n"
+                                                 "2022-06-01T12:00:00-06:00\n\n"
+                                                 "D\ttestfile\n"
+                                                 "2021-01-01T12:00:00-06:00\n\n"
+                                                 "A\ttestfile\n").encode('utf-8'),
+                                                "")
+    with patch('subprocess.run', MagicMock(return_value = ret_code_pass)) as subproc:
         test_obj = GetGitArchiveFileYears("testfile")
         startyear, modify_year = test_obj.get_file_years()
         assert startyear == '2023'
         assert modify_year == '2024'
+        subproc.assert_called_once()
+        assert subproc.call_args.args[0] == ["git", "log", "--name-status", "--format=%aI",
+                                             "testfile"]
 
-    # pylint: enable=too-many-locals
-
-def test015_get_years_start_fail(capsys):
+def test015_get_years_git_fail(capsys):
     """!
-    Test get_file_years(), Git pass
+    Test get_file_years(), Git cmd failed
     """
-    # pylint: disable=unused-argument
-    # pylint: disable=too-many-arguments
-    # pylint: disable=too-many-locals
-    def mockrun(args, *, stdin=None,
-                    inputstd=None, stdout=None,
-                    stderr=None, capture_output=False,
-                    shell=False, cwd=None,
-                    timeout=None, check=False,
-                    encoding=None, errors=None,
-                    text=None, env=None, universal_newlines=None,
-                    **other_popen_kwargs):
-
-        git_cmd = ""
-        prefix = ""
-        for element in args:
-            git_cmd += prefix
-            git_cmd += element
-            prefix = " "
-
-        ret_code = None
-        if args[2] == "-1":
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               0,
-                                               "2024-01-01T12:00:00-06:00".encode('utf-8'),
-                                               "")
-        elif args[2] == "--diff-filter=A":
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               2,
-                                               "git error msg".encode('utf-8'),
-                                               "")
-        else:
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               4,
-                                               "Git error".encode('utf-8'),
-                                               "")
-        return ret_code
-    # pylint: enable=unused-argument
-    # pylint: enable=too-many-arguments
-
-    with patch('subprocess.run', MagicMock(side_effect = mockrun)):
+    ret_code_fail = subprocess.CompletedProcess("git",
+                                                2,
+                                                "git error msg".encode('utf-8'),
+                                                "")
+    with patch('subprocess.run', MagicMock(return_value = ret_code_fail)):
         test_obj = GetGitArchiveFileYears("testfile")
         startyear, modify_year = test_obj.get_file_years()
         assert startyear is None
         assert modify_year is None
-        assert capsys.readouterr().out == "ERROR: Git creation date failed: git error msg\n"
-    # pylint: enable=too-many-locals
+        assert capsys.readouterr().out == "ERROR: Git file history failed: git error msg\n"
 
-def test016_get_years_las_mod_fail(capsys):
+def test016_get_years_empty_history(capsys):
     """!
-    Test get_file_years(), Git pass
+    Test get_file_years(), file not in the git archive
     """
-    # pylint: disable=unused-argument
-    # pylint: disable=too-many-arguments
-    # pylint: disable=too-many-locals
-    def mockrun(args, *, stdin=None,
-                    inputstd=None, stdout=None,
-                    stderr=None, capture_output=False,
-                    shell=False, cwd=None,
-                    timeout=None, check=False,
-                    encoding=None, errors=None,
-                    text=None, env=None, universal_newlines=None,
-                    **other_popen_kwargs):
-
-        git_cmd = ""
-        prefix = ""
-        for element in args:
-            git_cmd += prefix
-            git_cmd += element
-            prefix = " "
-
-        if args[2] == "-1":
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               2,
-                                               "git error msg".encode('utf-8'),
-                                               "")
-        elif args[2] == "--diff-filter=A":
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               0,
-                                               "2024-01-01T12:00:00-06:00".encode('utf-8'),
-                                               "")
-        else:
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               4,
-                                               "Git error".encode('utf-8'),
-                                               "")
-        return ret_code
-    # pylint: enable=unused-argument
-    # pylint: enable=too-many-arguments
-
-    with patch('subprocess.run', MagicMock(side_effect = mockrun)):
+    ret_code_empty = subprocess.CompletedProcess("git", 0, "".encode('utf-8'), "")
+    with patch('subprocess.run', MagicMock(return_value = ret_code_empty)):
         test_obj = GetGitArchiveFileYears("testfile")
         startyear, modify_year = test_obj.get_file_years()
         assert startyear is None
         assert modify_year is None
-        expected = capsys.readouterr().out
-        assert expected == "ERROR: Git last modification date failed: git error msg\n"
-    # pylint: enable=too-many-locals
+        assert capsys.readouterr().out == "ERROR: Git file history is empty for file: " \
+                                          "testfile\n"
 
 def test017_get_year_git():
     """!
@@ -386,15 +285,11 @@ def test017_get_year_git():
             git_cmd += prefix
             git_cmd += element
             prefix = " "
-        if args[2] == "-1":
-            ret_code = subprocess.CompletedProcess(git_cmd,
-                                               0,
-                                               "2025-01-01T12:00:00-06:00".encode('utf-8'),
-                                               "")
-        elif args[2] == "--diff-filter=A":
+        if args[2] == "--name-status":
             ret_code = subprocess.CompletedProcess(git_cmd,
                                                0,
-                                               "2022-01-01T12:00:00-06:00".encode('utf-8'),
+                                               ("2025-01-01T12:00:00-06:00\n"
+                                                "2022-01-01T12:00:00-06:00\n").encode('utf-8'),
                                                "")
         else:
             ret_code = subprocess.CompletedProcess(git_cmd,
@@ -513,3 +408,69 @@ def test021_get_years_fail_not_file(capsys):
                 assert modify_year is None
                 expected = "ERROR: File: \"testfile\" does not exist or is not a file.\n"
                 assert capsys.readouterr().out == expected
+
+def test022_get_years_system_failure(capsys):
+    """!
+    Test get_file_years(), Git subprocess failure
+    """
+    ret_code_error = subprocess.CompletedProcess("", 2, "git error msg", "")
+    with patch('subprocess.run', MagicMock(return_value = ret_code_error)) as subproc:
+        subproc.side_effect = subprocess.CalledProcessError(2, "git_cmd", "", "git error msg")
+        test_obj = GetGitArchiveFileYears("testfile")
+        startyear, modify_year = test_obj.get_file_years()
+        assert startyear is None
+        assert modify_year is None
+        assert capsys.readouterr().out == "ERROR: Git file history command failed for " \
+                                          "file: testfile\n"
+
+def test023_get_years_git_index():
+    """!
+    @brief Test get_tree_file_years() uses the git archive year index
+    """
+    git_log = ("\0" + "2025-03-01T12:00:00-06:00\0\nM\0testfile\0M\0src/new file.py\0"
+               "\0" + "2024-03-01T12:00:00-06:00\0"
+               "\0" + "2023-02-01T12:00:00-06:00\0\nR100\0src/old.py\0src/new file.py\0"
+               "A\0\u00fc.c\0"
+               "\0" + "2022-01-01T12:00:00-06:00\0\nA\0testfile\0"
+               "\0" + "2021-01-01T12:00:00-06:00\0\nD\0testfile\0M\0shallow.py\0"
+               "\0" + "2020-01-01T12:00:00-06:00\0\nA\0testfile\0A\0src/old.py\0"
+               "\0" + "2019-01-01T12:00:00-06:00\0\nM\0shallow.py\0")
+    ret_code_pass = subprocess.CompletedProcess("git", 0, git_log.encode('utf-8'), "")
+
+    with patch('os.path.exists', MagicMock(return_value = True)):
+        with patch('os.path.isfile', MagicMock(return_value = True)):
+            with patch('os.path.isdir', MagicMock(return_value = True)):
+                with patch('subprocess.run', MagicMock(return_value = ret_code_pass)) as subproc:
+                    file_paths = ["testfile", "src/new file.py", "\u00fc.c", "src/old.py",
+                                  "shallow.py"]
+                    assert list(get_tree_file_years(file_paths)) == [
+                        ("testfile", ('2022', '2025')),
+                        ("src/new file.py", ('2023', '2025')),
+                        ("\u00fc.c", ('2023', '2023')),
+                        ("src/old.py", ('2020', '2023')),
+                        ("shallow.py", ('2019', '2021'))]
+                    subproc.assert_called_once()
+                    assert subproc.call_args.args[0] == ["git", "log", "--name-status", "-z",
+                                                         "--format=%x00%aI"]
+
+def test024_get_years_git_index_missing_file():
+    """!
+    @brief Test get_tree_file_years() queries git for a file that is not in the index and
+           get_file_years() does not load the index
+    """
+    git_log = "\0" + "2025-03-01T12:00:00-06:00\0\nother.py\0"
+    git_file_log = "2024-01-01T12:00:00-06:00\n2022-01-01T12:00:00-06:00\n"
+    ret_code_list = [subprocess.CompletedProcess("git", 0, git_log.encode('utf-8'), ""),
+                     subprocess.CompletedProcess("git", 0, git_file_log.encode('utf-8'), ""),
+                     subprocess.CompletedProcess("git", 0, git_file_log.encode('utf-8'), "")]
+
+    with patch('os.path.exists', MagicMock(return_value = True)):
+        with patch('os.path.isfile', MagicMock(return_value = True)):
+            with patch('os.path.isdir', MagicMock(return_value = True)):
+                with patch('subprocess.run', MagicMock(side_effect = ret_code_list)) as subproc:
+                    assert list(get_tree_file_years(["testfile"])) == [
+                        ("testfile", ('2022', '2024'))]
+                    assert get_file_years("testfile") == ('2022', '2024')
+                    assert subproc.call_count == 3
+                    assert subproc.call_args.args[0] == ["git", "log", "--name-status",
+                                                         "--format=%aI", "testfile"]
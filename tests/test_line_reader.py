@@ -0,0 +1,314 @@
+"""@package copyright_maintenance_unittest
+Unittest for copyright maintenance utility
+"""
+
+#==========================================================================
+# Copyright (c) 2026 Randal Eike
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of self software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and self permission notice shall be included
+# in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+# CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#==========================================================================
+
+import io
+import os
+
+from copyright_maintenance_grocsoftware.line_reader import FileLineReader
+from copyright_maintenance_grocsoftware.line_reader import open_for_scan
+from copyright_maintenance_grocsoftware.comment_block import CommentBlock
+from copyright_maintenance_grocsoftware.comment_block import CommentParams
+from copyright_maintenance_grocsoftware.copyright_finder import CopyrightFinder
+
+from tests.dir_init import TEST_FILE_PATH
+TEST_FILE_BASE_DIR = TEST_FILE_PATH
+
+def test001_read_lines_match_readline():
+    """!
+    @brief Test the line offsets and text match the readline()/tell() values
+    """
+    testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.c")
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        expected = []
+        while True:
+            line_offset = testfile.tell()
+            line = testfile.readline()
+            if not line:
+                break
+            expected.append((line_offset, line))
+
+        testfile.seek(0)
+        assert list(FileLineReader(testfile)) == expected
+
+class NonSeekableStream(io.BytesIO):
+    """!
+    @brief Byte stream that does not support seek() or tell()
+    """
+    def seekable(self):
+        """!
+        @brief Report the stream can not seek
+        @return bool - False
+        """
+        return False
+
+def test002_read_lines_small_chunks():
+    """!
+    @brief Test chunked reads, lines spanning multiple read chunks, match the mapped file
+    """
+    testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.txt")
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        expected = list(FileLineReader(testfile))
+
+    with open(testfile_path, "rb") as testfile:
+        test_data = testfile.read()
+
+    test_stream = NonSeekableStream(test_data)
+    line_reader = FileLineReader(test_stream, 7)
+    assert list(line_reader) == expected
+    line_reader.update_file_position()
+
+    assert list(FileLineReader(io.BytesIO(test_data))) == expected
+
+def test003_read_lines_no_line_terminator():
+    """!
+    @brief Test the last line of a file without a line terminator
+    """
+    test_stream = io.BytesIO(b"line 1\nline 2")
+    assert list(FileLineReader(test_stream)) == [(0, "line 1\n"), (7, "line 2")]
+
+def test004_read_lines_multibyte_offsets():
+    """!
+    @brief Test the line offsets are byte offsets for multi-byte characters
+    """
+    test_stream = io.BytesIO("© me\nline 2\n".encode("utf-8"))
+    assert list(FileLineReader(test_stream)) == [(0, "© me\n"), (6, "line 2\n")]
+
+def test005_read_lines_string_stream():
+    """!
+    @brief Test reading from a text only stream
+    """
+    test_stream = io.StringIO("line 1\nline 2\n")
+    assert list(FileLineReader(test_stream)) == [(0, "line 1\n"), (7, "line 2\n")]
+
+def test006_update_file_position():
+    """!
+    @brief Test the file location is restored to the next unread line
+    """
+    testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.txt")
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        testfile.readline()
+        start_offset = testfile.tell()
+        second_line = testfile.readline()
+        third_line = testfile.readline()
+
+        testfile.seek(start_offset)
+        line_reader = FileLineReader(testfile)
+        for line_offset, line in line_reader:
+            assert line_offset == start_offset
+            assert line == second_line
+            break
+
+        line_reader.update_file_position()
+        assert testfile.readline() == third_line
+
+def test007_read_lines_end_of_file():
+    """!
+    @brief Test reading from the end of the file
+    """
+    testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile2.txt")
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        testfile.read()
+        line_reader = FileLineReader(testfile)
+        assert not list(line_reader)
+        line_reader.update_file_position()
+        assert testfile.readline() == ""
+
+def test008_read_lines_empty_file(tmp_path):
+    """!
+    @brief Test an empty file, which can not be memory mapped
+    """
+    testfile_path = tmp_path / "empty.txt"
+    testfile_path.write_text("", encoding="utf-8")
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        line_reader = FileLineReader(testfile)
+        assert not list(line_reader)
+        line_reader.update_file_position()
+
+def test009_open_for_scan():
+    """!
+    @brief Test the scan file open helper
+    """
+    testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.c")
+    with open_for_scan(testfile_path) as testfile:
+        assert testfile.mode == "rt"
+        assert testfile.encoding == "utf-8"
+        assert testfile.buffer.raw.name == testfile_path
+        line_offset, line = next(iter(FileLineReader(testfile)))
+        assert line_offset == 0
+        assert line.startswith("/*")
+
+def test010_find_lines_match_filtered_lines():
+    """!
+    @brief Test the mapped file literal search returns the same lines as a line filter
+    """
+    literals = ("Copyright", "COPYRIGHT", "copyright")
+    for file_name in ("testfile.c", "testfile.py", "testfile_nomsg.py"):
+        testfile_path = os.path.join(TEST_FILE_BASE_DIR, file_name)
+        with open(testfile_path, "rt", encoding="utf-8") as testfile:
+            expected = [(line_offset, line) for line_offset, line in FileLineReader(testfile)
+                        if any(literal in line for literal in literals)]
+            testfile.seek(0)
+            line_reader = FileLineReader(testfile)
+            assert list(line_reader.find_lines(literals)) == expected
+            line_reader.update_file_position()
+            assert testfile.readline() == ""
+
+def test011_find_lines_end_offset():
+    """!
+    @brief Test the literal search stops at the end offset and leaves the file there
+    """
+    testfile_path = os.path.join(TEST_FILE_BASE_DIR, "testfile.py")
+    with open(testfile_path, "rb") as testfile:
+        test_data = testfile.read()
+
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        line_list = list(FileLineReader(testfile))
+        copyright_index = next(index for index, (_, line) in enumerate(line_list)
+                               if "Copyright" in line)
+        copyright_offset, copyright_line = line_list[copyright_index]
+        next_line_offset = line_list[copyright_index + 1][0]
+
+        for end_offset, expected, end_location in (
+                (copyright_offset, [], copyright_offset),
+                (copyright_offset + 1, [(copyright_offset, copyright_line)], next_line_offset)):
+            # Mapped file
+            testfile.seek(0)
+            line_reader = FileLineReader(testfile)
+            assert list(line_reader.find_lines(("Copyright",), end_offset)) == expected
+            line_reader.update_file_position()
+            assert testfile.tell() == end_location
+
+            # Unmapped stream
+            test_stream = io.BytesIO(test_data)
+            line_reader = FileLineReader(test_stream)
+            assert list(line_reader.find_lines(("Copyright",), end_offset)) == expected
+            line_reader.update_file_position()
+            assert test_stream.tell() == end_location
+
+def test012_find_lines_no_literals():
+    """!
+    @brief Test the line search without literals returns every line up to the end offset
+    """
+    test_stream = io.BytesIO(b"line 1\nline 2\nline 3\n")
+    line_reader = FileLineReader(test_stream)
+    assert list(line_reader.find_lines(None, 8)) == [(0, "line 1\n"), (7, "line 2\n")]
+    line_reader.update_file_position()
+    assert test_stream.tell() == 14
+
+def test013_find_lines_streams():
+    """!
+    @brief Test the literal search of in memory and non-seekable streams
+    """
+    test_data = "int x;\n// Copyright\n// none\n// copyright\n"
+    expected = [(7, "// Copyright\n"), (28, "// copyright\n")]
+    literals = ("Copyright", "copyright")
+
+    assert list(FileLineReader(io.StringIO(test_data)).find_lines(literals)) == expected
+    assert list(FileLineReader(io.BytesIO(test_data.encode())).find_lines(literals)) == expected
+    test_stream = NonSeekableStream(test_data.encode())
+    assert list(FileLineReader(test_stream).find_lines(literals)) == expected
+
+def _readline_lines(testfile)->list:
+    """!
+    @brief Read the file lines with the readline()/tell() loop
+    @param testfile (file): Open file to read from the start
+    @return list: (file offset of the line start, line text) tuples
+    """
+    expected = []
+    testfile.seek(0)
+    while True:
+        line_offset = testfile.tell()
+        line = testfile.readline()
+        if not line:
+            break
+        expected.append((line_offset, line))
+    testfile.seek(0)
+    return expected
+
+C_TEST_TEXT = "/*\n * Copyright (c) 2022 Randal Eike\n */\nint x;\n"
+
+def test014_read_lines_utf16(tmp_path):
+    """!
+    @brief Test the lines of a UTF-16 file match the readline()/tell() values
+    """
+    testfile_path = tmp_path / "utf16.c"
+    testfile_path.write_text(C_TEST_TEXT, encoding="utf-16")
+    with open(testfile_path, "rt", encoding="utf-16") as testfile:
+        expected = _readline_lines(testfile)
+        assert list(FileLineReader(testfile)) == expected
+
+        testfile.seek(0)
+        line_reader = FileLineReader(testfile)
+        assert list(line_reader.find_lines(("Copyright",))) == [expected[1]]
+
+        testfile.seek(0)
+        comment_block = CommentBlock(testfile, CommentParams.get_comment_markers("utf16.c"))
+        assert comment_block.find_next_comment_block()
+        assert comment_block.comment_blk_strt_off == expected[0][0]
+        assert comment_block.comment_blk_eol_off == expected[3][0]
+
+        testfile.seek(0)
+        copyright_found, location_dict = CopyrightFinder().find_copyright_msg(testfile)
+        assert copyright_found
+        assert location_dict['text'] == ' * Copyright (c) 2022 Randal Eike\n'
+
+def test015_read_lines_crlf(tmp_path):
+    """!
+    @brief Test the lines of a CRLF file are translated like the readline() lines
+    """
+    testfile_path = tmp_path / "crlf.c"
+    testfile_path.write_bytes(C_TEST_TEXT.replace("\n", "\r\n").encode("utf-8"))
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        expected = _readline_lines(testfile)
+        assert list(FileLineReader(testfile)) == expected
+
+        testfile.seek(0)
+        line_reader = FileLineReader(testfile)
+        assert list(line_reader.find_lines(("Copyright",), expected[2][0])) == [expected[1]]
+        line_reader.update_file_position()
+        assert testfile.tell() == expected[2][0]
+
+        testfile.seek(0)
+        copyright_found, location_dict = CopyrightFinder().find_copyright_msg(testfile)
+        assert copyright_found
+        assert location_dict['text'] == ' * Copyright (c) 2022 Randal Eike\n'
+
+def test016_read_lines_cr_only(tmp_path):
+    """!
+    @brief Test the lines of a CR only file are split like the readline() lines
+    """
+    testfile_path = tmp_path / "cr.c"
+    testfile_path.write_bytes(C_TEST_TEXT.replace("\n", "\r").encode("utf-8"))
+    with open(testfile_path, "rt", encoding="utf-8") as testfile:
+        expected = _readline_lines(testfile)
+        assert len(expected) == 4
+        assert list(FileLineReader(testfile)) == expected
+
+        testfile.seek(0)
+        comment_block = CommentBlock(testfile, CommentParams.get_comment_markers("cr.c"))
+        assert comment_block.find_next_comment_block()
+        assert comment_block.comment_blk_strt_off == 0
+        assert comment_block.comment_blk_eol_off == expected[3][0]
@@ -41,6 +41,7 @@ from copyright_maintenance_grocsoftware.file_dates import get_file_years
 from copyright_maintenance_grocsoftware.oscmdshell import get_command_shell
 from copyright_maintenance_grocsoftware.update_copyright import CopyrightCommentBlock
 from copyright_maintenance_grocsoftware.update_copyright import update_copyright_years
+from copyright_maintenance_grocsoftware.update_copyright import update_tree_copyright_years
 
 from tests.dir_init import TEST_FILE_PATH
 TEST_FILE_BASE_DIR = TEST_FILE_PATH
@@ -335,3 +336,32 @@ class TestClass02CopyrightUpdate:
                 expected_err_str += "None returned from get_file_years() for creation year\n"
                 expected_err_str += "None returned from get_file_years() for year year\n"
                 assert output.getvalue() == expected_err_str
+
+class TestClass03CopyrightTreeUpdate: # pylint: disable=too-few-public-methods
+    """!
+    @brief Test the update_tree_copyright_years function
+    """
+    def test001_update_tree_years(self, tmp_path):
+        """!
+        Test update_tree_copyright_years() reads the years of all the files at once
+        """
+        file_paths = []
+        for file_name in ("a.c", "b.c"):
+            file_path = tmp_path / file_name
+            file_path.write_text("/*\n * Copyright (c) 2022 Randal Eike\n */\n"
+                                 "/*\n * Test file\n */\nint x;\n", encoding="utf-8")
+            file_paths.append(str(file_path))
+
+        tree_years = MagicMock(return_value = iter([(file_paths[0], ('2022', '2024')),
+                                                    (file_paths[1], ('2021', '2022'))]))
+        with patch('copyright_maintenance_grocsoftware.update_copyright.get_tree_file_years',
+                   tree_years):
+            with patch('copyright_maintenance_grocsoftware.update_copyright.get_file_years',
+                       MagicMock(side_effect = AssertionError)):
+                update_tree_copyright_years(file_paths)
+
+        tree_years.assert_called_once_with(file_paths)
+        assert " * Copyright (c) 2022-2024 Randal Eike\n" in \
+               (tmp_path / "a.c").read_text(encoding="utf-8")
+        assert " * Copyright (c) 2021-2022 Randal Eike\n" in \
+               (tmp_path / "b.c").read_text(encoding="utf-8")